@@ -3,19 +3,80 @@ Author: Louis Goodnews
 Date: 2025-08-20
 """
 
-from typing import Final, List, Literal
+from __future__ import annotations
 
-from .core.core import (
-    BaseObjectBuilder,
-    ImmutableBaseObject,
-    MutableBaseObject,
-)
+import sys
 
 
-__all__: Final[List[str]] = [
+__all__ = (
     "BaseObjectBuilder",
     "ImmutableBaseObject",
     "MutableBaseObject",
-]
+)
+
+__version__ = "0.1.0"
+
+# Names re-exported from the core module on first access
+_LAZY = frozenset(__all__)
+
+# Fully qualified name of the module providing the re-exported names
+_CORE_MODULE = f"{__name__}.core.core"
+
+
+def __getattr__(name: str) -> object:
+    """
+    Resolve the lazily re-exported names on first access.
+
+    Importing the package does not import the core module. The first access
+    to one of the re-exported names probes sys.modules once, imports the core
+    module only if it is missing and stores the name in the module globals,
+    so later lookups no longer reach this function.
+
+    :param name: The name of the attribute to resolve.
+    :type name: str
+
+    :return: The resolved attribute.
+    :rtype: object
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+
+    # Check if the name is not re-exported from the core module
+    if name not in _LAZY:
+        # Raise an AttributeError if the name is not exported by the package
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Get the core module from the module cache
+    module = sys.modules.get(_CORE_MODULE)
+
+    # Check if the core module has not been imported yet
+    if module is None:
+        from importlib import import_module
+
+        # Import the core module
+        module = import_module(_CORE_MODULE)
+
+    # Get the attribute from the core module
+    value = getattr(
+        module,
+        name,
+    )
+
+    # Store the attribute in the module globals to skip this hook next time
+    globals()[name] = value
+
+    # Return the resolved attribute
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Return the names available on the package, including the lazy ones.
+
+    :return: A sorted list of the names available on the package.
+    :rtype: list[str]
+    """
 
-__version__: Final[Literal["0.1.0"]] = "0.1.0"
+    # Return the module globals together with the lazily re-exported names
+    return sorted(set(globals()) | _LAZY)
@@ -3,13 +3,24 @@ Author: Louis Goodnews
 Date: 2025-08-20
 """
 
+from __future__ import annotations
+
 import copy
+import inspect
 import json
+import sys
 
 from collections.abc import ItemsView, KeysView, ValuesView
+from operator import attrgetter
+from types import NoneType, UnionType
 from typing import (
     Any,
     Final,
+    ForwardRef,
+    get_args,
+    get_origin,
+    get_type_hints,
+    Iterable,
     Iterator,
     Literal,
     Optional,
@@ -18,12 +29,449 @@ from typing import (
     Union,
 )
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional dependency for faster JSON parsing
+    orjson = None
+
+try:
+    from annotationlib import Format
+except ImportError:
+    # annotationlib is only available from Python 3.14 on
+    Format = None
+
+
+# JSON encoders used by to_json, equivalent to json.dumps() with and without sort_keys
+_JSON_ENCODER: Final[json.JSONEncoder] = json.JSONEncoder()
+_SORTED_JSON_ENCODER: Final[json.JSONEncoder] = json.JSONEncoder(sort_keys=True)
+
+# Marker for attributes that are not set, as None is a valid value
+_MISSING: Final[object] = object()
+
+# Attribute setters of object, bound once instead of going through super() on every write
+_object_setattr: Final = object.__setattr__
+_object_delattr: Final = object.__delattr__
+
+# Locked names shared by immutable objects until they lock an attribute
+_NO_LOCKS: Final[frozenset[str]] = frozenset()
+
+# Immutable built-in types that copy.deepcopy returns unchanged
+_ATOMIC_TYPES: Final[frozenset[type]] = frozenset(
+    {
+        bool,
+        bytes,
+        complex,
+        float,
+        int,
+        NoneType,
+        str,
+    }
+)
+
+# Built-in containers whose items are copied recursively by deep_copy
+_CONTAINER_TYPES: Final[tuple[type, ...]] = (
+    dict,
+    list,
+    set,
+    tuple,
+)
+
+# Exact types of the built-in containers, for hashed lookups by type(value)
+_CONTAINER_TYPE_SET: Final[frozenset[type]] = frozenset(_CONTAINER_TYPES)
+
+
+def _own_annotations(klass: type) -> dict[str, Any]:
+    """
+    Return the annotations defined by a class itself.
+
+    From Python 3.14 on, annotations are evaluated lazily and no longer
+    stored in the '__dict__' of the class, so they are read with
+    inspect.get_annotations(). Names that are not defined yet are returned
+    as forward references instead of raising a NameError.
+
+    :param klass: The class to get the annotations of.
+    :type klass: type
+
+    :return: The annotations of the class, possibly unevaluated.
+    :rtype: dict[str, Any]
+    """
+
+    # Check if annotations are evaluated lazily
+    if Format is None:
+        # Return the annotations stored on the class
+        return inspect.get_annotations(klass)
+
+    # Return the annotations, keeping undefined names as forward references
+    return inspect.get_annotations(
+        klass,
+        format=Format.FORWARDREF,
+    )
+
+
+def _unwrap_optional(type_: Any) -> Any:
+    """
+    Return X for an Optional[X] or X | None annotation, and the annotation itself otherwise.
+
+    :param type_: The annotation to unwrap.
+    :type type_: Any
+
+    :return: The annotation without the None option.
+    :rtype: Any
+    """
+
+    # Check if the annotation is not a union
+    if get_origin(type_) not in (
+        Union,
+        UnionType,
+    ):
+        # Return the annotation unchanged
+        return type_
+
+    # Get the options of the union other than None
+    options: tuple[Any, ...] = tuple(option for option in get_args(type_) if option is not NoneType)
+
+    # Check if the union is not an optional single type
+    if len(options) != 1:
+        # Return the annotation unchanged
+        return type_
+
+    # Return the single type of the optional
+    return options[0]
+
+
+def _loads(string: str) -> Any:
+    """
+    Parse a JSON string with orjson if it is installed, and with json otherwise.
+
+    orjson rejects some input that json accepts and to_json can produce,
+    e.g. NaN or integers beyond 64 bits. Such strings are parsed with json.
+
+    :param string: The JSON string to parse.
+    :type string: str
+
+    :return: The parsed value.
+    :rtype: Any
+
+    Raises:
+        json.JSONDecodeError: If the string is not valid JSON.
+    """
+
+    # Check if orjson is installed
+    if orjson is not None:
+        try:
+            # Parse the string with orjson
+            return orjson.loads(string)
+        except orjson.JSONDecodeError:
+            # Fall back to json for input orjson does not accept
+            pass
+
+    # Parse the string with json
+    return json.loads(string)
+
+
+def _copy_leaf(
+    value: Any,
+    memo: dict[int, Any],
+    as_mutable: bool,
+) -> tuple[Optional[type], Any]:
+    """
+    Copy a value that is not a container still to be walked.
+
+    :param value: The value to copy.
+    :type value: Any
+    :param memo: The objects already copied, keyed by the id of the original.
+    :type memo: dict[int, Any]
+    :param as_mutable: Whether nested base objects are copied as mutable objects.
+    :type as_mutable: bool
+
+    :return: (None, copy) for copied values, or (container type, None) for
+             built-in containers that have not been copied yet.
+    :rtype: tuple[Optional[type], Any]
+    """
+
+    # Get the exact type of the value
+    value_type: type = type(value)
+
+    # Check if the value is immutable and can be shared by the copy
+    if value_type in _ATOMIC_TYPES:
+        # Return the value itself, as copy.deepcopy would
+        return (
+            None,
+            value,
+        )
+
+    # Check if the value is not exactly one of the built-in containers
+    if value_type not in _CONTAINER_TYPE_SET:
+        # Check if the value is an ImmutableBaseObject or MutableBaseObject
+        if isinstance(
+            value,
+            MutableBaseObject,
+        ):
+            # Return the existing copy of the object, or a deep copy sharing the memo
+            return (
+                None,
+                (
+                    memo[id(value)]
+                    if id(value) in memo
+                    else value._deep_copy(
+                        memo,
+                        as_mutable,
+                    )
+                ),
+            )
+
+        # Check if the value is not a subclass of a built-in container
+        if not isinstance(
+            value,
+            _CONTAINER_TYPES,
+        ):
+            # Return a deep copy of the value, sharing the memo
+            return (
+                None,
+                copy.deepcopy(
+                    value,
+                    memo,
+                ),
+            )
+
+        # Copy subclasses of the built-in containers as the container itself
+        value_type = next(
+            container_type
+            for container_type in _CONTAINER_TYPES
+            if isinstance(
+                value,
+                container_type,
+            )
+        )
+
+    # Check if the container has already been copied
+    if id(value) in memo:
+        # Return the existing copy of the container
+        return (
+            None,
+            memo[id(value)],
+        )
+
+    # Return the type of the container to walk
+    return (
+        value_type,
+        None,
+    )
+
+
+def _open_frame(
+    value: Any,
+    value_type: type,
+    memo: dict[int, Any],
+) -> list[Any]:
+    """
+    Create the frame used to walk a container.
+
+    A frame is a list of the original container, its type, the copy
+    being filled, an iterator over its items and the key of the item
+    being copied.
+
+    :param value: The container to walk.
+    :type value: Any
+    :param value_type: The built-in container type of the value.
+    :type value_type: type
+    :param memo: The objects already copied, keyed by the id of the original.
+    :type memo: dict[int, Any]
+
+    :return: The frame of the container.
+    :rtype: list[Any]
+    """
+
+    # Check if the container is a dictionary
+    if value_type is dict:
+        # Register the copy before filling it so cycles resolve to it
+        target = memo[id(value)] = {}
+
+        # Return the frame walking the items of the dictionary
+        return [value, value_type, target, iter(value.items()), None]
+
+    # Check if the container is a list
+    if value_type is list:
+        # Register the copy before filling it so cycles resolve to it
+        target = memo[id(value)] = []
+    else:
+        # Collect the items of sets and tuples before building them
+        target = []
+
+    # Return the frame walking the items of the container
+    return [value, value_type, target, iter(value), None]
+
+
+def _deep_copy_value(
+    value: Any,
+    memo: dict[int, Any],
+    as_mutable: bool,
+) -> Any:
+    """
+    Copy a value, walking nested containers with an explicit stack
+    instead of recursion.
+
+    :param value: The value to copy.
+    :type value: Any
+    :param memo: The objects already copied, keyed by the id of the original.
+    :type memo: dict[int, Any]
+    :param as_mutable: Whether nested base objects are copied as mutable objects.
+    :type as_mutable: bool
+
+    :return: A deep copy of the value.
+    :rtype: Any
+    """
+
+    # Copy the value if it is not a container to walk
+    (
+        value_type,
+        result,
+    ) = _copy_leaf(
+        value,
+        memo,
+        as_mutable,
+    )
+
+    # Check if the value has been copied
+    if value_type is None:
+        # Return the copy of the value
+        return result
+
+    # Initialize the stack of containers being walked
+    stack: list[list[Any]] = [
+        _open_frame(
+            value,
+            value_type,
+            memo,
+        )
+    ]
+
+    # Walk the containers until the outermost one is complete
+    while True:
+        # Get the frame of the innermost container
+        frame: list[Any] = stack[-1]
+
+        # Get the type and the copy of the container
+        container_type: type = frame[1]
+        target: Any = frame[2]
+
+        # Iterate over the remaining items of the container
+        for item in frame[3]:
+            # Check if the container is a dictionary
+            if container_type is dict:
+                # Split the item into its key and value
+                (
+                    key,
+                    item,
+                ) = item
+            else:
+                # Items of other containers have no key
+                key = None
+
+            # Check if the item is immutable and can be shared by the copy
+            if type(item) in _ATOMIC_TYPES:
+                # Use the item itself, as copy.deepcopy would
+                item_type = None
+                copied = item
+            else:
+                # Copy the item if it is not a container to walk
+                (
+                    item_type,
+                    copied,
+                ) = _copy_leaf(
+                    item,
+                    memo,
+                    as_mutable,
+                )
+
+            # Check if the item is a container to walk
+            if item_type is not None:
+                # Remember where to store the copy of the item
+                frame[4] = key
+
+                # Walk the item next
+                stack.append(
+                    _open_frame(
+                        item,
+                        item_type,
+                        memo,
+                    )
+                )
+                break
+
+            # Store the copy of the item
+            if container_type is dict:
+                target[key] = copied
+            else:
+                target.append(copied)
+        else:
+            # The container is complete
+            stack.pop()
+
+            # Check if the container is a set or a tuple, built from its collected items
+            if container_type is set or container_type is tuple:
+                # Check if a cycle through the container has already built its copy
+                if id(frame[0]) in memo:
+                    # Use the existing copy, as copy.deepcopy does
+                    target = memo[id(frame[0])]
+                else:
+                    # Build the copy from the collected items
+                    target = memo[id(frame[0])] = container_type(target)
+
+            # Check if the outermost container is complete
+            if not stack:
+                # Return the copy of the value
+                return target
+
+            # Get the frame of the enclosing container
+            parent: list[Any] = stack[-1]
+
+            # Store the copy in the enclosing container
+            if parent[1] is dict:
+                parent[2][parent[4]] = target
+            else:
+                parent[2].append(target)
+
+
+class _FieldProperty(property):
+    """
+    The property created for a field by MutableBaseObject._create_property().
+
+    Fields whose class attribute is such a property are known to store their
+    value under the storage name without any further checks.
+    """
+
 
 class MutableBaseObject:
     """
     A class representing a mutable base object.
     """
 
+    # The annotated fields of the class as (name, type) pairs, or None while
+    # the annotations cannot be resolved yet. Set for every subclass.
+    _ANNOTATIONS = ()
+
+    # The names of the annotated fields of the class. Set for every subclass.
+    _ANNOTATION_KEYS = frozenset()
+
+    # The annotated fields of the class as (storage name, name) pairs. Set for every subclass.
+    _FIELDS = ()
+
+    # Whether the fields of the class are set through the created properties
+    # and a generic '__setattr__' method only, so that they may be stored in
+    # the instance dictionary directly. Set for every subclass.
+    _PLAIN_FIELDS = True
+
+    # Source lines the generated '__init__' method runs before setting the fields
+    _INIT_PROLOGUE = ()
+
+    # Source lines the generated '__init__' method runs after setting the fields
+    _INIT_EPILOGUE = ()
+
+    # Mutable objects compare by their attributes, so they are not hashable
+    __hash__ = None
+
     def __init__(
         self,
         **kwargs: Any,
@@ -41,64 +489,25 @@ class MutableBaseObject:
         :rtype: None
         """
 
-        # Get the annotations of the object
-        annotations: dict[str, Any] = getattr(
-            self,
-            "__annotations__",
-            {},
-        )
-
-        def set_attr(
-            name: str,
-            value: Any,
-            expected_type: Any,
-        ) -> None:
-            """
-            Helper to set an attribute with type check and property creation.
+        # Get the class of the object
+        cls: Type[MutableBaseObject] = type(self)
 
-            :param name: The name of the attribute to set.
-            :type name: str
-            :param value: The value to set the attribute to.
-            :type value: Any
-            :param expected_type: The expected type of the attribute.
-            :type expected_type: Any
+        # Get the annotated fields of the class, cached when the class was defined
+        annotations: Optional[tuple[tuple[str, Any], ...]] = cls._ANNOTATIONS
 
-            :return: None
-            :rtype: None
-            """
+        # Store the attributes directly, unless the class customizes how they are set
+        store: Any = _object_setattr if cls._PLAIN_FIELDS else setattr
 
-            # Check if the value is not None and the expected type is not None and the value is not of the expected type
-            if (
-                value is not None
-                and expected_type is not None
-                and not isinstance(
-                    value,
-                    expected_type,
-                )
-            ):
-                # Attempt to cast the value to the expected type
-                try:
-                    value = expected_type(value)
-                except Exception:
-                    # Raise a TypeError if the value is not of the expected type
-                    raise TypeError(
-                        f"Invalid type for field '{name}': expected {expected_type}, got {type(value)}"
-                    )
+        # Check if the annotations could not be resolved when the class was defined
+        if annotations is None:
+            # Resolve the annotations now that forward references should be defined
+            annotations = cls._resolve_annotations()
 
-            # Set the attribute on the object
-            setattr(
-                self,
-                f"_{name}",
-                value,
-            )
+            # Generate the '__init__' method used from now on
+            cls._generate_init()
 
-            # Check if the property exists on the class
-            if not hasattr(
-                self.__class__,
-                name,
-            ):
-                # Create the property
-                self._create_property(name)
+            # Generate the '__repr__' method used from now on
+            cls._generate_repr()
 
         # Check if the annotations are not empty
         if annotations:
@@ -106,27 +515,49 @@ class MutableBaseObject:
             for (
                 name,
                 type_,
-            ) in annotations.items():
-                # Set the attribute on the object
-                set_attr(
+            ) in annotations:
+                # Get the value of the attribute
+                value: Any = kwargs.get(
                     name,
-                    kwargs.get(
-                        name,
-                        None,
-                    ),
-                    type_,
+                    None,
                 )
 
-            # Unexpected arguments
-            for extra in set(
-                kwargs.keys(),
-            ) - set(
-                annotations.keys(),
-            ):
-                # Raise a TypeError if the argument is unexpected
-                raise TypeError(
-                    f"Unexpected argument: '{extra}'",
+                # Check if the value is not None and the expected type is not None
+                # and the value is not of the expected type, comparing the exact
+                # type first to skip isinstance() for values that already have it
+                if (
+                    value is not None
+                    and type_ is not None
+                    and type(value) is not type_
+                    and not isinstance(
+                        value,
+                        type_,
+                    )
+                ):
+                    # Attempt to cast the value to the expected type
+                    try:
+                        value = type_(value)
+                    except Exception:
+                        # Raise a TypeError if the value is not of the expected type
+                        raise TypeError(
+                            f"Invalid type for field '{name}': expected {type_}, got {type(value)}"
+                        )
+
+                # Set the attribute on the object
+                store(
+                    self,
+                    f"_{name}",
+                    value,
                 )
+
+            # Check for unexpected arguments with a subset test, which allocates nothing
+            if not kwargs.keys() <= cls._ANNOTATION_KEYS:
+                # Unexpected arguments
+                for extra in kwargs.keys() - cls._ANNOTATION_KEYS:
+                    # Raise a TypeError if the argument is unexpected
+                    raise TypeError(
+                        f"Unexpected argument: '{extra}'",
+                    )
         else:
             # Non-annotated attributes
             for (
@@ -134,12 +565,21 @@ class MutableBaseObject:
                 value,
             ) in kwargs.items():
                 # Set the attribute on the object
-                set_attr(
-                    name,
+                store(
+                    self,
+                    f"_{name}",
                     value,
-                    None,
                 )
 
+                # Check if the property exists on the class, as non-annotated
+                # names are only known once the object is created
+                if not hasattr(
+                    cls,
+                    name,
+                ):
+                    # Create the property
+                    cls._create_property(name)
+
         # Call __post_init__ if it exists
         if hasattr(self, "__post_init__"):
             self.__post_init__()
@@ -161,13 +601,25 @@ class MutableBaseObject:
         # Check if the other object is an instance of the same class
         if not isinstance(
             other,
-            self.__class__,
+            type(self),
         ):
             # Return NotImplemented if the other object is not an instance of the same class
             return NotImplemented
 
-        # Return a new object created by adding the attributes of this object and the other object
-        return self.__class__(**dict(vars(self)) | dict(vars(other)))
+        # Return a new object created by adding the attributes of this object and the other object,
+        # mapping the stored attribute names back to the names accepted by the constructor
+        return type(self)(
+            **{
+                (key[1:] if key[:1] == "_" else key): value
+                for (
+                    key,
+                    value,
+                ) in (
+                    *vars(self).items(),
+                    *vars(other).items(),
+                )
+            },
+        )
 
     def __contains__(
         self,
@@ -176,6 +628,9 @@ class MutableBaseObject:
         """
         Check if the object contains an attribute.
 
+        The item may be given by its storage name, e.g. '_name', or by its
+        field name, e.g. 'name'. Use contains_value() to check for a value.
+
         :param item: The item to check.
         :type item: Any
 
@@ -183,23 +638,37 @@ class MutableBaseObject:
         :rtype: bool
         """
 
+        # Get the attributes of the object
+        attributes: dict[str, Any] = vars(self)
+
         # Check if the item exists on the object
-        return item in vars(self).keys() or item in vars(self).values()
+        return item in attributes or (
+            isinstance(
+                item,
+                str,
+            )
+            and f"_{item}" in attributes
+        )
 
     def __copy__(self) -> "MutableBaseObject":
         """
         Return a copy of the object.
 
+        The copy is created without calling '__init__', as the attributes of
+        the object have already been checked and set up.
+
         :return: A copy of the object.
         :rtype: MutableBaseObject
         """
 
-        attributes: dict[str, Any] = {
-            key.lstrip("_"): value for key, value in vars(self).items() if not key.startswith("_")
-        }
+        # Create the copy without initializing it
+        copied: MutableBaseObject = object.__new__(type(self))
 
-        # Return a copy of the object
-        return self.__class__(**attributes)
+        # Copy the attributes of the object into the copy
+        copied.__dict__.update(vars(self))
+
+        # Return the copy of the object
+        return copied
 
     def __delitem__(
         self,
@@ -215,21 +684,24 @@ class MutableBaseObject:
         :rtype: None
         """
 
-        # Check if the attribute exists on the object
-        if not hasattr(
-            self,
-            key,
-        ):
-            # Raise a KeyError if the attribute does not exist
-            raise KeyError(
-                f"{key!r} not found in {self.__class__.__name__}",
+        try:
+            # Delete the attribute from the object
+            delattr(
+                self,
+                key,
             )
+        except AttributeError:
+            # Re-raise the error if the attribute exists but cannot be deleted
+            if hasattr(
+                self,
+                key,
+            ):
+                raise
 
-        # Delete the attribute from the object
-        delattr(
-            self,
-            key,
-        )
+            # Raise a KeyError if the attribute does not exist
+            raise KeyError(
+                f"{key!r} not found in {type(self).__name__}",
+            ) from None
 
     def __eq__(
         self,
@@ -245,8 +717,13 @@ class MutableBaseObject:
         :rtype: bool
         """
 
+        # Check if the other object is an instance of the same class
+        if type(other) is not type(self):
+            # Return NotImplemented if the other object is not an instance of the same class
+            return NotImplemented
+
         # Check if the objects are equal
-        return dict(vars(self)) == dict(vars(other))
+        return vars(self) == vars(other)
 
     def __getitem__(
         self,
@@ -262,21 +739,17 @@ class MutableBaseObject:
         :rtype: Any
         """
 
-        # Check if the attribute exists on the object
-        if not hasattr(
-            self,
-            key,
-        ):
+        try:
+            # Return the attribute from the object
+            return getattr(
+                self,
+                key,
+            )
+        except AttributeError:
             # Raise a KeyError if the attribute does not exist
             raise KeyError(
-                f"{key!r} not found in {self.__class__.__name__}",
-            )
-
-        # Return the attribute from the object
-        return getattr(
-            self,
-            key,
-        )
+                f"{key!r} not found in {type(self).__name__}",
+            ) from None
 
     def __gt__(
         self,
@@ -292,8 +765,69 @@ class MutableBaseObject:
         :rtype: bool
         """
 
+        # Check if the other object is an instance of the same class
+        if type(other) is not type(self):
+            # Return NotImplemented if the other object is not an instance of the same class
+            return NotImplemented
+
         # Check if the object is greater than the other object
-        return dict(vars(self)) > dict(vars(other))
+        return vars(self) > vars(other)
+
+    def __init_subclass__(
+        cls,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize a subclass of the base object.
+
+        This method caches the annotated fields of the subclass, generates its
+        '__init__' method and creates the properties once, when the class is
+        defined, instead of looking them up every time an object is created.
+
+        :param kwargs: Keyword arguments passed on to the parent class.
+        :type kwargs: dict[str, Any]
+
+        :return: None
+        :rtype: None
+        """
+
+        # Call the parent class method
+        super().__init_subclass__(
+            **kwargs,
+        )
+
+        # Cache the names of the annotated fields of the class
+        cls._ANNOTATION_KEYS = frozenset(cls._get_annotations())
+
+        # Cache the storage names of the annotated fields of the class
+        cls._FIELDS = tuple((f"_{name}", name) for name in cls._get_annotations())
+
+        # Iterate over the fields annotated on the subclass itself
+        for name in _own_annotations(cls):
+            # Check if the property exists on the class
+            if not hasattr(
+                cls,
+                name,
+            ):
+                # Create the property
+                cls._create_property(name)
+
+        # Cache whether the fields may be stored without going through the
+        # properties and the '__setattr__' method of the class
+        cls._PLAIN_FIELDS = cls._has_plain_fields()
+
+        try:
+            # Cache the annotated fields of the class
+            cls._resolve_annotations()
+        except NameError:
+            # Defer the resolution of forward references to the first instantiation
+            cls._ANNOTATIONS = None
+        else:
+            # Generate the '__init__' method of the class
+            cls._generate_init()
+
+            # Generate the '__repr__' method of the class
+            cls._generate_repr()
 
     def __iter__(self) -> Iterator[tuple[str, Any]]:
         """
@@ -331,8 +865,13 @@ class MutableBaseObject:
         :rtype: bool
         """
 
+        # Check if the other object is an instance of the same class
+        if type(other) is not type(self):
+            # Return NotImplemented if the other object is not an instance of the same class
+            return NotImplemented
+
         # Check if the object is less than the other object
-        return dict(vars(self)) < dict(vars(other))
+        return vars(self) < vars(other)
 
     def __repr__(self) -> str:
         """
@@ -342,8 +881,11 @@ class MutableBaseObject:
         :rtype: str
         """
 
+        # Format the attributes of the object
+        attributes: str = ", ".join([f"{key}={value!r}" for (key, value) in vars(self).items()])
+
         # Return a string representation of the object
-        return f"<{self.__class__.__name__} ({', '.join(f'{key}={value!r}' for (key, value,) in dict(vars(self)).items())})>"
+        return f"<{type(self).__name__} ({attributes})>"
 
     def __setitem__(
         self,
@@ -395,7 +937,7 @@ class MutableBaseObject:
         """
 
         # Return a new object created by subtracting the other object from this object
-        return self.__class__(
+        return type(self)(
             **{k: v for k, v in vars(self).items() if k not in vars(other)},
         )
 
@@ -414,15 +956,8 @@ class MutableBaseObject:
         :rtype: None
         """
 
-        def getter(self) -> Any:
-            """
-            Get the value of the field.
-
-            :return: The value of the field.
-            :rtype: Any
-            """
-
-            return getattr(self, f"_{name}")
+        # Build the storage name of the field once, instead of on every set
+        private: str = sys.intern(f"_{name}")
 
         def setter(
             self,
@@ -438,18 +973,475 @@ class MutableBaseObject:
             :rtype: None
             """
 
-            setattr(self, f"_{name}", value)
+            # Set the value under the storage name
+            setattr(
+                self,
+                private,
+                value,
+            )
 
-        # Set the property on the class
+        # Set the property on the class, reading the field through a C-level
+        # attrgetter instead of a Python getter function
         setattr(
             cls,
             name,
-            property(
-                getter,
+            _FieldProperty(
+                attrgetter(private),
                 setter,
             ),
         )
 
+    def _deep_copy(
+        self,
+        memo: dict[int, Any],
+        as_mutable: bool,
+    ) -> Union["MutableBaseObject", "ImmutableBaseObject"]:
+        """
+        Return a deep copy of the object, sharing the memo of an enclosing copy.
+
+        :param memo: The objects already copied, keyed by the id of the original.
+        :type memo: dict[int, Any]
+        :param as_mutable: Whether the copy and nested base objects are mutable objects.
+        :type as_mutable: bool
+
+        :return: A deep copy of the object.
+        :rtype: MutableBaseObject or ImmutableBaseObject
+        """
+
+        # Create the copy without initializing it yet
+        copied: MutableBaseObject = object.__new__(
+            MutableBaseObject if as_mutable else type(self),
+        )
+
+        # Register the copy before copying the fields, so that cycles back to
+        # the object and shared references to it resolve to the copy
+        memo[id(self)] = copied
+
+        # Get the attributes of the object
+        attributes: dict[str, Any] = vars(self)
+
+        # Get the annotated fields of the class
+        fields: tuple[tuple[str, str], ...] = type(self)._FIELDS
+
+        # Check if the class has annotated fields
+        if fields:
+            # Copy the fields recursively, using the storage names cached on the class
+            # and sharing immutable values without calling the walker
+            copied_attributes: dict[str, Any] = {
+                name: (
+                    value
+                    if type(value) in _ATOMIC_TYPES
+                    else _deep_copy_value(
+                        value,
+                        memo,
+                        as_mutable,
+                    )
+                )
+                for (
+                    storage,
+                    name,
+                ) in fields
+                for value in (attributes.get(storage),)
+            }
+        else:
+            # Copy all stored attributes of the object recursively,
+            # sharing immutable values without calling the walker
+            copied_attributes = {
+                key[1:]: (
+                    value
+                    if type(value) in _ATOMIC_TYPES
+                    else _deep_copy_value(
+                        value,
+                        memo,
+                        as_mutable,
+                    )
+                )
+                for (
+                    key,
+                    value,
+                ) in attributes.items()
+                if key[:1] == "_"
+            }
+
+        # Initialize the copy with the copied fields, as the constructor would
+        type(copied).__init__(
+            copied,
+            **copied_attributes,
+        )
+
+        # Return the copy of the object
+        return copied
+
+    @classmethod
+    def _generate_init(cls) -> None:
+        """
+        Generate a specialized '__init__' method for the annotated fields of the class.
+
+        The generated method does the work of the generic '__init__' method
+        with every field inlined, so that no annotations are iterated per
+        object. It is only generated for classes that inherit the generic
+        '__init__' method and falls back to it for instances of subclasses.
+
+        :return: None
+        :rtype: None
+        """
+
+        # Get the annotated fields of the class
+        annotations: Optional[tuple[tuple[str, Any], ...]] = cls._ANNOTATIONS
+
+        # Check if there are no resolved annotated fields or the class
+        # defines its own '__init__' method
+        if not annotations or "__init__" in cls.__dict__:
+            # Keep the inherited '__init__' method
+            return
+
+        # Get the generic '__init__' method the class inherits
+        base_init: Any = getattr(
+            cls.__init__,
+            "__base_init__",
+            cls.__init__,
+        )
+
+        # Check if the inherited '__init__' method is not a generic one
+        if base_init not in (
+            MutableBaseObject.__init__,
+            ImmutableBaseObject.__init__,
+        ):
+            # Keep the inherited '__init__' method
+            return
+
+        # Initialize the namespace the generated method is executed in
+        namespace: dict[str, Any] = {
+            "_NO_LOCKS": _NO_LOCKS,
+            "_base_init": base_init,
+            "_cls": cls,
+            "_keys": cls._ANNOTATION_KEYS,
+            "_object_setattr": _object_setattr,
+        }
+
+        # Initialize the lines of the generated method
+        lines: list[str] = [
+            "def __init__(self, **kwargs):",
+            "    if type(self) is not _cls:",
+            "        return _base_init(self, **kwargs)",
+        ]
+
+        # Add the lines the class runs before the fields are set
+        lines += [f"    {line}" for line in cls._INIT_PROLOGUE]
+
+        # Iterate over the annotated fields
+        for (
+            index,
+            (
+                name,
+                type_,
+            ),
+        ) in enumerate(annotations):
+            # Get the value of the attribute
+            lines.append(f"    v{index} = kwargs.get({name!r})")
+
+            # Check if the expected type is None
+            if type_ is None:
+                # Skip the type check
+                continue
+
+            # Add the expected type to the namespace
+            namespace[f"t{index}"] = type_
+
+            # Check the type of the value and attempt to cast it, exactly like
+            # the generic '__init__' method
+            lines += [
+                f"    if v{index} is not None and type(v{index}) is not t{index}"
+                f" and not isinstance(v{index}, t{index}):",
+                "        try:",
+                f"            v{index} = t{index}(v{index})",
+                "        except Exception:",
+                f"            raise TypeError(f\"Invalid type for field {name!r}:"
+                f" expected {{t{index}}}, got {{type(v{index})}}\")",
+            ]
+
+        # Check if the attributes may be stored in the instance dictionary directly
+        if cls._PLAIN_FIELDS:
+            # Set the attributes in the instance dictionary
+            lines.append("    d = self.__dict__")
+            lines += [
+                f"    d[{f'_{name}'!r}] = v{index}"
+                for (
+                    index,
+                    (
+                        name,
+                        _,
+                    ),
+                ) in enumerate(annotations)
+            ]
+        else:
+            # Set the attributes through the '__setattr__' method of the class
+            lines += [
+                f"    self._{name} = v{index}"
+                for (
+                    index,
+                    (
+                        name,
+                        _,
+                    ),
+                ) in enumerate(annotations)
+            ]
+
+        # Raise a TypeError for the first unexpected argument
+        lines += [
+            "    if not kwargs.keys() <= _keys:",
+            "        for extra in kwargs.keys() - _keys:",
+            "            raise TypeError(f\"Unexpected argument: '{extra}'\")",
+        ]
+
+        # Check if the class defines __post_init__
+        if hasattr(cls, "__post_init__"):
+            # Call __post_init__
+            lines.append("    self.__post_init__()")
+
+        # Add the lines the class adds after the fields have been set
+        lines += [f"    {line}" for line in cls._INIT_EPILOGUE]
+
+        # Execute the source of the generated method
+        exec(
+            "\n".join(lines),
+            namespace,
+        )
+
+        # Get the generated method
+        init: Any = namespace["__init__"]
+
+        # Make the generated method look like a method of the class
+        init.__qualname__ = f"{cls.__qualname__}.__init__"
+        init.__module__ = cls.__module__
+        init.__doc__ = base_init.__doc__
+
+        # Remember the generic '__init__' method for subclasses
+        init.__base_init__ = base_init
+
+        # Set the generated method on the class
+        cls.__init__ = init
+
+    @classmethod
+    def _generate_repr(cls) -> None:
+        """
+        Generate a specialized '__repr__' method for the annotated fields of the class.
+
+        The generated method formats the fields with a single prebuilt format
+        string. It falls back to the generic '__repr__' method for instances
+        of subclasses and for objects whose attributes differ from the fields.
+        '__str__' is set to the same method so that it does not go through
+        '__repr__' again.
+
+        :return: None
+        :rtype: None
+        """
+
+        # Check if the class inherits a generated '__str__' method without the
+        # '__repr__' method it was generated as, e.g. as it overrides '__repr__'
+        if hasattr(cls.__str__, "__base_repr__") and cls.__str__ is not cls.__repr__:
+            # Use the generic '__str__' method, which calls the '__repr__' method of the class
+            cls.__str__ = MutableBaseObject.__str__
+
+        # Check if there are no resolved annotated fields or the class
+        # defines its own '__repr__' method
+        if not cls._ANNOTATIONS or "__repr__" in cls.__dict__:
+            # Keep the inherited '__repr__' method
+            return
+
+        # Get the generic '__repr__' method the class inherits
+        base_repr: Any = getattr(
+            cls.__repr__,
+            "__base_repr__",
+            cls.__repr__,
+        )
+
+        # Check if the inherited '__repr__' method is not the generic one
+        if base_repr is not MutableBaseObject.__repr__:
+            # Keep the inherited '__repr__' method
+            return
+
+        # Get the names of the attributes every object of the class has
+        names: list[str] = [f"_{name}" for (name, _) in cls._ANNOTATIONS]
+
+        # Build the format string of the representation
+        template: str = f"<{cls.__name__} ({', '.join([f'{name}=%r' for name in names])})>"
+
+        # Initialize the namespace the generated method is executed in
+        namespace: dict[str, Any] = {
+            "_base_repr": base_repr,
+            "_cls": cls,
+        }
+
+        # Execute the source of the generated method
+        exec(
+            "\n".join(
+                [
+                    "def __repr__(self):",
+                    "    d = self.__dict__",
+                    f"    if type(self) is _cls and len(d) == {len(names)}:",
+                    "        try:",
+                    f"            return {template!r}"
+                    f" % ({''.join([f'd[{name!r}], ' for name in names])})",
+                    "        except KeyError:",
+                    "            pass",
+                    "    return _base_repr(self)",
+                ]
+            ),
+            namespace,
+        )
+
+        # Get the generated method
+        repr_: Any = namespace["__repr__"]
+
+        # Make the generated method look like a method of the class
+        repr_.__qualname__ = f"{cls.__qualname__}.__repr__"
+        repr_.__module__ = cls.__module__
+        repr_.__doc__ = base_repr.__doc__
+
+        # Remember the generic '__repr__' method for subclasses
+        repr_.__base_repr__ = base_repr
+
+        # Set the generated method on the class
+        cls.__repr__ = repr_
+
+        # Check if the class inherits the generic '__str__' method
+        if "__str__" not in cls.__dict__ and (
+            cls.__str__ is MutableBaseObject.__str__
+            or hasattr(cls.__str__, "__base_repr__")
+        ):
+            # Use the generated method directly for '__str__'
+            cls.__str__ = repr_
+
+    @classmethod
+    def _get_annotations(cls) -> dict[str, Any]:
+        """
+        Return the annotations that apply to instances of the class.
+
+        These are the annotations of the first class in the MRO that defines
+        any, which is what looking up '__annotations__' on an instance returns.
+        Annotations that cannot be evaluated yet are forward references.
+
+        :return: The annotations of the class, possibly unevaluated strings.
+        :rtype: dict[str, Any]
+        """
+
+        # Iterate over the classes in the method resolution order
+        for klass in cls.__mro__:
+            # Get the annotations defined by the class itself
+            annotations: dict[str, Any] = _own_annotations(klass)
+
+            # Check if the class defines its own annotations
+            if annotations:
+                # Return the annotations of the class
+                return annotations
+
+        # Return an empty dictionary if no class defines annotations
+        return {}
+
+    @classmethod
+    def _has_plain_fields(cls) -> bool:
+        """
+        Check if the fields of the class may be stored in the instance dictionary directly.
+
+        This is the case if the class uses the '__setattr__' method of object
+        or of ImmutableBaseObject and every annotated field is read and set
+        through the property created for it, so that no custom setter or
+        '__setattr__' method is skipped.
+
+        :return: True if the fields may be stored directly, False otherwise.
+        :rtype: bool
+        """
+
+        # Get the '__setattr__' method of the class
+        setattr_: Any = cls.__setattr__
+
+        # Check if the class customizes how attributes are set
+        if setattr_ is not object.__setattr__ and not hasattr(
+            setattr_,
+            "__base_setattr__",
+        ):
+            # Attributes must be set through the '__setattr__' method
+            return False
+
+        # Check if every field is set through the property created for it
+        return all(
+            type(
+                getattr(
+                    cls,
+                    name,
+                    None,
+                )
+            )
+            is _FieldProperty
+            for name in cls._ANNOTATION_KEYS
+        )
+
+    @classmethod
+    def _resolve_annotations(cls) -> tuple[tuple[str, Any], ...]:
+        """
+        Resolve the annotated fields of the class and cache them on it.
+
+        String annotations, e.g. from modules using postponed evaluation, and
+        forward references are evaluated with typing.get_type_hints().
+        Optional[X] is stored as X, as None values are never checked.
+
+        :return: The annotated fields of the class as (name, type) pairs.
+        :rtype: tuple[tuple[str, Any], ...]
+
+        Raises:
+            NameError: If an annotation refers to a name that is not defined.
+        """
+
+        # Get the annotations of the class
+        annotations: dict[str, Any] = cls._get_annotations()
+
+        # Check if any annotation has not been evaluated yet
+        if any(
+            isinstance(
+                type_,
+                (str, ForwardRef),
+            )
+            for type_ in annotations.values()
+        ):
+            # Resolve the string annotations into the actual types
+            hints: dict[str, Any] = get_type_hints(cls)
+
+            # Keep only the annotations of the class
+            annotations = {name: hints[name] for name in annotations}
+
+        # Cache the annotated fields on the class, with Optional[X] unwrapped into X
+        cls._ANNOTATIONS = tuple(
+            (
+                name,
+                _unwrap_optional(type_),
+            )
+            for (
+                name,
+                type_,
+            ) in annotations.items()
+        )
+
+        # Return the annotated fields
+        return cls._ANNOTATIONS
+
+    def contains_value(
+        self,
+        value: Any,
+    ) -> bool:
+        """
+        Check if any attribute of the object has the given value.
+
+        :param value: The value to check.
+        :type value: Any
+
+        :return: True if the value exists on the object, False otherwise.
+        :rtype: bool
+        """
+
+        # Check if the value exists on the object
+        return value in vars(self).values()
+
     def copy(self) -> "MutableBaseObject":
         """
         Return a copy of the object.
@@ -458,14 +1450,8 @@ class MutableBaseObject:
         :rtype: MutableBaseObject
         """
 
-        attributes: dict[str, Any] = {
-            key.lstrip("_"): value for key, value in vars(self).items() if not key.startswith("_")
-        }
-
         # Return a copy of the object
-        return self.__class__(
-            **attributes,
-        )
+        return self.__copy__()
 
     def deep_copy(
         self,
@@ -478,86 +1464,25 @@ class MutableBaseObject:
         :type as_mutable: bool
 
         :return: A deep copy of the object.
-        :rtype: MutableBaseObject or ImmutableBaseObject
-        """
-
-        def _deep_copy_value(value) -> Any:
-            """
-            Recursively copy a value.
-
-            :param value: The value to copy.
-            :type value: Any
-
-            :return: A deep copy of the value.
-            :rtype: Any
-            """
-
-            # Check if the value is an ImmutableBaseObject or MutableBaseObject
-            if isinstance(
-                value,
-                (
-                    MutableBaseObject,
-                    ImmutableBaseObject,
-                ),
-            ):
-                # Return a deep copy of the value
-                return value.deep_copy(as_mutable=as_mutable)
-            elif isinstance(
-                value,
-                dict,
-            ):
-                # Return a deep copy of the value
-                return {k: _deep_copy_value(v) for k, v in value.items()}
-            elif isinstance(
-                value,
-                list,
-            ):
-                # Return a deep copy of the value
-                return [_deep_copy_value(v) for v in value]
-            elif isinstance(
-                value,
-                set,
-            ):
-                # Return a deep copy of the value
-                return {_deep_copy_value(v) for v in value}
-            elif isinstance(
-                value,
-                tuple,
-            ):
-                # Return a deep copy of the value
-                return tuple(_deep_copy_value(v) for v in value)
-            else:
-                # Return a deep copy of the value
-                return copy.deepcopy(value)
-
-        # Copy all attributes of the object recursively
-        copied_attributes: dict[str, Any] = {
-            key.lstrip("_"): _deep_copy_value(value)
-            for (
-                key,
-                value,
-            ) in vars(self).items()
-            if key.startswith("_") and key != "_locked_"
-        }
-
-        # Check if the object should be mutable
-        if as_mutable:
-            # Return a mutable copy of the object
-            return MutableBaseObject(**copied_attributes)
+        :rtype: MutableBaseObject or ImmutableBaseObject
+        """
 
-        # Return an immutable copy of the object
-        return self.__class__(**copied_attributes)
+        # Copy the object with a memo shared by all of its nested values
+        return self._deep_copy(
+            {},
+            as_mutable,
+        )
 
-    def enumerate(self) -> list[tuple[int, tuple[str, Any]]]:
+    def enumerate(self) -> Iterator[tuple[int, tuple[str, Any]]]:
         """
-        Return a list of attribute names and values on the object with their index.
+        Return an iterator over the attribute names and values on the object with their index.
 
-        :return: A list of attribute names and values on the object with their index.
-        :rtype: list[tuple[int, tuple[str, Any]]]
+        :return: An iterator over the attribute names and values on the object with their index.
+        :rtype: Iterator[tuple[int, tuple[str, Any]]]
         """
 
-        # Return a list of attribute names and values on the object with their index
-        return list(enumerate(iterable=vars(self).items()))
+        # Return an iterator over the attribute names and values on the object with their index
+        return enumerate(vars(self).items())
 
     def equals(
         self,
@@ -580,22 +1505,21 @@ class MutableBaseObject:
         if keys is None:
             return vars(self) == vars(other)
 
+        # Compare the given attributes, stopping at the first difference
         return all(
-            [
-                (
-                    getattr(
-                        self,
-                        key,
-                        None,
-                    )
-                    == getattr(
-                        other,
-                        key,
-                        None,
-                    )
+            (
+                getattr(
+                    self,
+                    key,
+                    None,
+                )
+                == getattr(
+                    other,
+                    key,
+                    None,
                 )
-                for key in keys
-            ],
+            )
+            for key in keys
         )
 
     def filter_by_type(
@@ -630,8 +1554,13 @@ class MutableBaseObject:
         :rtype: MutableBaseObject
         """
 
+        # Map the stored attribute names back to the names accepted by the constructor
         attributes: dict[str, Any] = {
-            key.lstrip("_"): value for key, value in kwargs.items() if not key.startswith("_")
+            (key[1:] if key[:1] == "_" else key): value
+            for (
+                key,
+                value,
+            ) in kwargs.items()
         }
 
         # Return a new object created from the dictionary
@@ -645,6 +1574,9 @@ class MutableBaseObject:
         """
         Create a new object from a JSON string.
 
+        The string is parsed with orjson if it is installed and with the json
+        module otherwise.
+
         :param string: A JSON string to create an object from.
         :type string: str
 
@@ -652,9 +1584,12 @@ class MutableBaseObject:
         :rtype: MutableBaseObject
         """
 
-        # Return a new object created from the JSON string
+        # Parse the JSON string, preferring orjson if it is installed
+        data: dict[str, Any] = _loads(string)
+
+        # Return a new object created from the parsed dictionary
         return cls.from_dict(
-            **json.loads(string),
+            **data,
         )
 
     def get(
@@ -674,18 +1609,11 @@ class MutableBaseObject:
         :rtype: Optional[Any]
         """
 
-        # Check if the attribute exists on the object
-        if not hasattr(
-            self,
-            key,
-        ):
-            # Return the default value
-            return default
-
-        # Return the attribute from the object
+        # Return the attribute from the object or the default value in a single lookup
         return getattr(
             self,
             key,
+            default,
         )
 
     def get_or_default(
@@ -725,12 +1653,13 @@ class MutableBaseObject:
         :param value: The value of the attribute to check.
         :type value: Optional[Any]
 
-        :return: True if the object has the attribute with the given name and value, False otherwise.
+        :return: True if the object has the attribute with the given name and value,
+                 False otherwise.
         :rtype: bool
         """
 
         # Add the underscore prefix to the key if it doesn't start with it
-        if key is not None and not key.startswith("_"):
+        if key is not None and key[:1] != "_":
             # Add the underscore prefix to the key
             key = f"_{key}"
 
@@ -739,8 +1668,14 @@ class MutableBaseObject:
 
         # Check if both a key and value were passed
         if key is not None and value is not None:
-            # Return True if the object has any matching attributes
-            return key in attributes.keys() and value in attributes.values()
+            # Return True if the attribute with the given name has the given value
+            return (
+                attributes.get(
+                    key,
+                    _MISSING,
+                )
+                == value
+            )
 
         # Check if a key was passed
         if key is not None:
@@ -757,24 +1692,24 @@ class MutableBaseObject:
 
     def items(self) -> ItemsView[str, Any]:
         """
-        Return a list of attribute names and values on the object.
+        Return a view of the attribute names and values on the object.
 
-        :return: A list of attribute names and values on the object.
+        :return: A live view of the attribute names and values on the object.
         :rtype: ItemsView[str, Any]
         """
 
-        # Return a list of attribute names and values on the object
+        # Return a view of the attribute names and values on the object, without copying them
         return vars(self).items()
 
     def keys(self) -> KeysView[str]:
         """
-        Return a list of attribute names on the object.
+        Return a view of the attribute names on the object.
 
-        :return: A list of attribute names on the object.
+        :return: A live view of the attribute names on the object.
         :rtype: KeysView[str]
         """
 
-        # Return a list of attribute names on the object
+        # Return a view of the attribute names on the object, without copying them
         return vars(self).keys()
 
     def set(
@@ -810,54 +1745,50 @@ class MutableBaseObject:
         """
         Convert the object to a dictionary.
 
+        :param allow_leading_underscores: Whether to keep attribute names with a leading underscore.
+        :type allow_leading_underscores: bool
         :param exclude: A list of attribute names to exclude from the dictionary.
         :type exclude: Optional[list[str]]
-        :param sort: The sort order for the dictionary.
+        :param sort: The sort order of the keys, or None to keep the attribute order.
         :type sort: Optional[Literal["ascending", "descending"]]
 
         :return: A dictionary representation of the object.
         :rtype: dict[str, Any]
         """
 
-        # Get the dictionary of attributes
+        # Get the dictionary of attributes, dropping keys with a underscore prefix unless allowed
         dictionary: dict[str, Any] = {
             key: value
             for (
                 key,
                 value,
-            ) in sorted(
-                dict(vars(self)).items(),
-                reverse=sort == "ascending",
-            )
+            ) in vars(self).items()
+            if allow_leading_underscores or key[:1] != "_"
         }
 
-        # Check if keys with leading underscores are allowed
-        if not allow_leading_underscores:
-            # Update the dictionary to remove all keys with a underscore prefix
-            dictionary = {
-                key: value
-                for (
+        # Check if an exclude list is provided
+        if exclude:
+            # Iterate over the exclude list
+            for key in exclude:
+                # Remove the key from the dictionary
+                dictionary.pop(
                     key,
-                    value,
-                ) in dictionary.items()
-                if not key.startswith("_")
-            }
+                    None,
+                )
 
-        # Check if an exclude list is provided
-        if not exclude:
-            # Return the full dictionary
+        # Check if no sort order is provided
+        if sort is None:
+            # Return the dictionary
             return dictionary
 
-        # Iterate over the exclude list
-        for key in exclude:
-            # Remove the key from the dictionary
-            dictionary.pop(
-                key,
-                None,
+        # Return the dictionary with its keys sorted in the requested order
+        return {
+            key: dictionary[key]
+            for key in sorted(
+                dictionary,
+                reverse=sort == "descending",
             )
-
-        # Return the dictionary
-        return dictionary
+        }
 
     def to_filtered_dict(
         self,
@@ -877,18 +1808,26 @@ class MutableBaseObject:
         """
 
         # Get the dictionary of attributes
-        dictionary: dict[str, Any] = dict(vars(self))
+        dictionary: dict[str, Any] = vars(self)
 
         # Check if the keys parameter is provided
         if keys:
+            # Convert the keys to a frozenset once for constant-time lookups
+            wanted: frozenset[str] = frozenset(keys)
+
             # Filter the dictionary by keys
-            dictionary = {k: v for k, v in dictionary.items() if k in keys}
+            dictionary = {k: v for k, v in dictionary.items() if k in wanted}
 
         # Check if the type parameter is provided
         if typ:
             # Filter the dictionary by type
             dictionary = {k: v for k, v in dictionary.items() if isinstance(v, typ)}
 
+        # Check if the dictionary is still the attribute dictionary of the object
+        if dictionary is vars(self):
+            # Return a copy so callers cannot modify the object through it
+            return dict(dictionary)
+
         # Return the dictionary
         return dictionary
 
@@ -909,16 +1848,16 @@ class MutableBaseObject:
         :rtype: str
         """
 
-        # Get the dictionary of attributes
-        dictionary: dict[str, Any] = dict(vars(self))
+        # Get the encoder, reusing a prebuilt one instead of creating one per call
+        encoder: json.JSONEncoder = _SORTED_JSON_ENCODER if sort_keys else _JSON_ENCODER
 
         # Check if an exclude list is provided
         if not exclude:
-            # Return the full dictionary
-            return json.dumps(
-                dictionary,
-                sort_keys=sort_keys,
-            )
+            # Return the attributes serialized directly, without copying them
+            return encoder.encode(vars(self))
+
+        # Get the dictionary of attributes
+        dictionary: dict[str, Any] = dict(vars(self))
 
         # Iterate over the exclude list
         for key in exclude:
@@ -929,10 +1868,7 @@ class MutableBaseObject:
             )
 
         # Return the dictionary
-        return json.dumps(
-            dictionary,
-            sort_keys=sort_keys,
-        )
+        return encoder.encode(dictionary)
 
     def update(
         self,
@@ -948,17 +1884,32 @@ class MutableBaseObject:
         :rtype: None
         """
 
+        # Get the class of the object
+        cls: Type[MutableBaseObject] = type(self)
+
+        # Get the names of the annotated fields that may be stored directly,
+        # which are none if the class customizes how its fields are set
+        fields: frozenset[str] = cls._ANNOTATION_KEYS if cls._PLAIN_FIELDS else frozenset()
+
+        # Get the attributes of the object
+        attributes: dict[str, Any] = vars(self)
+
         # Iterate over the key-value pairs in the kwargs dictionary
         for (
             name,
             value,
         ) in kwargs.items():
-            # Set the attribute on the object
-            setattr(
-                self,
-                name,
-                value,
-            )
+            # Check if the attribute is an annotated field that may be stored directly
+            if name in fields:
+                # Store the field in the instance dictionary, skipping the property setter
+                attributes[f"_{name}"] = value
+            else:
+                # Set the attribute on the object
+                setattr(
+                    self,
+                    name,
+                    value,
+                )
 
     def update_defaults(
         self,
@@ -979,10 +1930,14 @@ class MutableBaseObject:
             key,
             value,
         ) in defaults.items():
-            # Check if the attribute is not yet set
-            if hasattr(
-                self,
-                key,
+            # Check if the attribute is already set
+            if (
+                getattr(
+                    self,
+                    key,
+                    _MISSING,
+                )
+                is not _MISSING
             ):
                 # Skip the attribute
                 continue
@@ -996,13 +1951,13 @@ class MutableBaseObject:
 
     def values(self) -> ValuesView[Any]:
         """
-        Return a list of attribute values on the object.
+        Return a view of the attribute values on the object.
 
-        :return: A list of attribute values on the object.
+        :return: A live view of the attribute values on the object.
         :rtype: ValuesView[Any]
         """
 
-        # Return a list of attribute values on the object
+        # Return a view of the attribute values on the object, without copying them
         return vars(self).values()
 
 
@@ -1011,6 +1966,31 @@ class ImmutableBaseObject(MutableBaseObject):
     A class representing an immutable base object.
     """
 
+    # Keep the cached hash, the locked names and the names released with
+    # unlock_attribute() in slots, out of the attributes of the object. The
+    # released names are only set once an attribute has been unlocked.
+    __slots__ = (
+        "_hash_",
+        "_locked_",
+        "_unlocked_",
+    )
+
+    # Share the empty locked names at the start of the generated '__init__' method
+    _INIT_PROLOGUE = ('_object_setattr(self, "_locked_", _NO_LOCKS)',)
+
+    # Lock the passed attributes at the end of the generated '__init__' method,
+    # keeping the names __post_init__ may have locked and sharing the names of
+    # the fields of the class when exactly those are passed
+    _INIT_EPILOGUE = (
+        "if kwargs:",
+        "    if self._locked_ is not _NO_LOCKS:",
+        "        self._own_locked().update(kwargs)",
+        "    elif kwargs.keys() == _keys:",
+        '        _object_setattr(self, "_locked_", _keys)',
+        "    else:",
+        '        _object_setattr(self, "_locked_", set(kwargs))',
+    )
+
     def __init__(
         self,
         **kwargs: Any,
@@ -1027,18 +2007,34 @@ class ImmutableBaseObject(MutableBaseObject):
         :rtype: None
         """
 
+        # Share the empty locked names first, so that they exist while the
+        # attributes are set and while __post_init__ runs
+        _object_setattr(
+            self,
+            "_locked_",
+            _NO_LOCKS,
+        )
+
         # Call the parent class constructor
         super().__init__(
             **kwargs,
         )
 
-        # Initialize the lock dictionary instance variable
-        self._locked_: Final[dict[str, bool]] = {}
+        # Get the names of the annotated fields of the class
+        fields: frozenset[str] = type(self)._ANNOTATION_KEYS
 
-        # Iterate over the keys of the kwargs dictionary
-        for key in kwargs.keys():
-            # Lock the attribute
-            self._locked_[key] = True
+        # Check if exactly the annotated fields are passed and nothing is locked yet
+        if self._locked_ is _NO_LOCKS and kwargs and kwargs.keys() == fields:
+            # Share the names of the fields of the class as the locked names,
+            # which are copied before they are first modified
+            _object_setattr(
+                self,
+                "_locked_",
+                fields,
+            )
+        elif kwargs:
+            # Lock the passed attributes
+            self._own_locked().update(kwargs)
 
     @override
     def __copy__(
@@ -1048,6 +2044,9 @@ class ImmutableBaseObject(MutableBaseObject):
         """
         Return a shallow copy of the object.
 
+        An immutable copy is created without calling '__init__' and keeps
+        the locked and unlocked attributes of the object.
+
         :param as_mutable: If True, returns a mutable copy. Defaults to False.
         :type as_mutable: bool
 
@@ -1055,23 +2054,49 @@ class ImmutableBaseObject(MutableBaseObject):
         :rtype: MutableBaseObject or ImmutableBaseObject
         """
 
-        # Get the attributes of the object
-        attributes: dict[str, Any] = {
-            key.lstrip("_"): value
-            for (
-                key,
-                value,
-            ) in vars(self).items()
-            if not key.startswith("_")
-        }
+        # Get the names accepted by the constructor for the stored attribute names
+        names: list[str] = [(key[1:] if key[:1] == "_" else key) for key in vars(self)]
 
         # Check if the object should be mutable
         if as_mutable:
-            # Return a mutable copy of the object
-            return MutableBaseObject(**attributes)
-        else:
-            # Return an immutable copy of the object
-            return self.__class__(**attributes)
+            # Return a mutable copy of the object, created through the
+            # constructor so that the properties of the fields are set up
+            return MutableBaseObject(
+                **dict(
+                    zip(
+                        names,
+                        vars(self).values(),
+                    ),
+                ),
+            )
+
+        # Create an immutable copy of the object without initializing it
+        copied: ImmutableBaseObject = super().__copy__()
+
+        # Get the locked names of the object
+        locked: Union[set[str], frozenset[str]] = self._locked_
+
+        # Lock the same attributes on the copy, sharing the names if they
+        # are immutable and copying them otherwise
+        _object_setattr(
+            copied,
+            "_locked_",
+            locked if isinstance(locked, frozenset) else set(locked),
+        )
+
+        # Get the names released with unlock_attribute(), if any
+        unlocked: Optional[set[str]] = getattr(self, "_unlocked_", None)
+
+        # Keep the released names unlocked on the copy
+        if unlocked is not None:
+            _object_setattr(
+                copied,
+                "_unlocked_",
+                set(unlocked),
+            )
+
+        # Return the immutable copy of the object
+        return copied
 
     @override
     def __delattr__(
@@ -1092,50 +2117,98 @@ class ImmutableBaseObject(MutableBaseObject):
             AttributeError: If the attribute is locked.
         """
 
-        # Check if the instance is locked
-        self._check_locked(name=name)
+        # Check if the attribute is public and locked, inlined from _check_locked
+        if name[:1] != "_" and name in self._locked_:
+            # Raise an AttributeError if the attribute is not allowed to be modified
+            raise AttributeError(
+                f"Cannot modify immutable field '{name}' of object {type(self).__name__}",
+            )
 
         # Delete the attribute from the object
-        super().__delattr__(
+        _object_delattr(
+            self,
             name,
         )
 
+        # Drop the cached hash, as the attributes have changed
+        _object_setattr(
+            self,
+            "_hash_",
+            None,
+        )
+
         # Check, if the passed attribute is locked
         if name in self._locked_:
             # Release the attribute
-            self._locked_.pop(name)
+            self._own_locked().remove(name)
+
+        # Get the names released with unlock_attribute(), if any
+        unlocked: Optional[set[str]] = getattr(
+            self,
+            "_unlocked_",
+            None,
+        )
+
+        # Check if any attribute has been unlocked
+        if unlocked:
+            # Forget that the attribute has been unlocked, as it no longer exists
+            unlocked.discard(name)
 
     @override
-    def __delitem__(
-        self,
-        key: str,
-    ) -> None:
+    def __hash__(self) -> int:
         """
-        Delete an attribute from the object.
+        Return the hash of the object, computed from its attributes.
 
-        :param key: The name of the attribute to delete.
-        :type key: str
+        Only objects whose attributes are all locked are hashable, so that
+        equal objects have the same hash and the hash cannot change while
+        the object is stored in a set or used as a dictionary key. The hash
+        is cached on the object and dropped whenever an attribute is set,
+        deleted or unlocked.
 
-        :return: None
-        :rtype: None
+        :return: The hash of the object.
+        :rtype: int
 
         Raises:
-            AttributeError: If the object is immutable.
-            AttributeError: If the attribute is locked.
-        """
+            TypeError: If an attribute is not locked.
+            TypeError: If an attribute value is not hashable.
+        """
+
+        try:
+            # Get the cached hash of the object
+            cached: Optional[int] = self._hash_
+        except AttributeError:
+            # Objects created without '__init__' have no cached hash yet
+            cached = None
+
+        # Check if the hash has not been computed yet
+        if cached is None:
+            # Get the locked names of the object
+            locked: Union[set[str], frozenset[str]] = self._locked_
+
+            # Iterate over the stored attribute names of the object
+            for key in vars(self):
+                # Get the name of the attribute for its storage name
+                name: str = key[1:] if key[:1] == "_" else key
+
+                # Check if the attribute is not locked and may still change
+                if name not in locked:
+                    # Raise a TypeError, as the hash could change with the attribute
+                    raise TypeError(
+                        f"Unhashable object {type(self).__name__} with unlocked attribute '{name}'",
+                    )
 
-        # Check if the instance is locked
-        self._check_locked(name=key)
+            # Hash the attributes regardless of their order, as __eq__ does
+            cached = hash(frozenset(vars(self).items()))
 
-        # Delete the attribute from the object
-        super().__delitem__(
-            key,
-        )
+            # Cache the hash on the object
+            _object_setattr(
+                self,
+                "_hash_",
+                cached,
+            )
 
-        # Check, if the passed attribute is locked
-        if key in self._locked_:
-            # Release the attribute
-            self._locked_.pop(key)
+        # Return the hash of the object
+        return cached
 
     @override
     def __setattr__(
@@ -1159,28 +2232,42 @@ class ImmutableBaseObject(MutableBaseObject):
             AttributeError: If the attribute is locked.
         """
 
-        # Check if the instance is locked
-        self._check_locked(name=name)
+        # Check if the attribute is public and locked, inlined from _check_locked
+        if name[:1] != "_" and name in self._locked_:
+            # Raise an AttributeError if the attribute is not allowed to be modified
+            raise AttributeError(
+                f"Cannot modify immutable field '{name}' of object {type(self).__name__}",
+            )
 
         # Set the attribute on the object
-        super().__setattr__(
+        _object_setattr(
+            self,
             name,
             value,
         )
 
-    @override
-    def __setitem__(
+        # Drop the cached hash, as the attributes have changed
+        _object_setattr(
+            self,
+            "_hash_",
+            None,
+        )
+
+    # Mark the method as storing attributes like object.__setattr__() apart
+    # from the lock checks, so that the fields of subclasses that do not
+    # override it may still be stored directly
+    __setattr__.__base_setattr__ = True
+
+    def _check_locked(
         self,
-        key: str,
-        value: Any,
+        name: Optional[str] = None,
     ) -> None:
         """
-        Set an attribute on the object.
+        Raise an AttributeError if the object is locked and the attribute
+        name does not start with '_'.
 
-        :param key: The name of the attribute to set.
-        :type key: str
-        :param value: The value to set the attribute to.
-        :type value: Any
+        :param name: Optional field name for error message
+        :type name: Optional[str]
 
         :return: None
         :rtype: None
@@ -1190,55 +2277,85 @@ class ImmutableBaseObject(MutableBaseObject):
             AttributeError: If the attribute is locked.
         """
 
-        # Check if the instance is locked
-        self._check_locked(name=key)
+        # Check, if a name is passed, which is the common case
+        if name is not None:
+            # Check, if the attribute is public and locked, reading the set of
+            # locked names only for public names, as it may not exist yet
+            # while private attributes are restored
+            if name[:1] != "_" and name in self._locked_:
+                # Raise an AttributeError if the attribute is not allowed to be modified
+                raise AttributeError(
+                    f"Cannot modify immutable field '{name}' of object {type(self).__name__}",
+                )
 
-        # Set the attribute on the object
-        super().__setitem__(
-            key,
-            value,
+            # The attribute may be modified
+            return
+
+        # Raise an AttributeError if the object is immutable
+        raise AttributeError(
+            f"Cannot modify immutable object {type(self).__name__}",
         )
 
-    def _check_locked(
+    def _is_registered(
         self,
-        name: Optional[str] = None,
-    ) -> None:
+        name: str,
+    ) -> bool:
         """
-        Raise an AttributeError if the object is locked and the attribute
-        name does not start with '_'.
+        Check if an attribute can be locked or unlocked without allow_new.
 
-        :param name: Optional field name for error message
-        :type name: Optional[str]
+        An attribute is registered if it is locked, an annotated field of
+        the class or stored on the object, either under its own name or
+        under its storage name. Methods and other class attributes are not
+        registered.
 
-        :return: None
-        :rtype: None
+        :param name: The name of the attribute to check.
+        :type name: str
 
-        Raises:
-            AttributeError: If the object is immutable.
-            AttributeError: If the attribute is locked.
+        :return: True if the attribute is registered, False otherwise.
+        :rtype: bool
         """
 
-        # Check, if the passed name is None
-        if name is None:
-            # Raise an AttributeError if the object is immutable
-            raise AttributeError(
-                f"Cannot modify immutable object {self.__class__.__name__}",
-            )
+        # Check if the attribute is locked or an annotated field of the class
+        if name in self._locked_ or name in type(self)._ANNOTATION_KEYS:
+            return True
 
-        # Check, if the passed name starts with '_', i.e. if is private
-        if name.startswith("_"):
-            # Skip the check
-            return
+        # Get the attributes of the object
+        attributes: dict[str, Any] = vars(self)
 
-        # Get the locked state
-        locked: bool = self._locked_.get(name, False)
+        # Check if the attribute is stored on the object
+        return name in attributes or f"_{name}" in attributes
 
-        # Check, if the attribute is locked
-        if locked:
-            # Raise an AttributeError if the attribute is not allowed to be modified
-            raise AttributeError(
-                f"Cannot modify immutable field '{name}' of object {self.__class__.__name__}",
-            )
+    def _own_locked(self) -> set[str]:
+        """
+        Return the locked names of the object as a set owned by the object.
+
+        Objects share an immutable set of locked names until they lock an
+        attribute, so the shared set is copied before it is first modified.
+
+        :return: The locked names of the object.
+        :rtype: set[str]
+        """
+
+        # Get the locked names of the object
+        locked: Union[set[str], frozenset[str]] = self._locked_
+
+        # Check if the locked names are already owned by the object
+        if type(locked) is set:
+            # Return the locked names
+            return locked
+
+        # Copy the shared locked names
+        owned: set[str] = set(locked)
+
+        # Set the copy on the object
+        _object_setattr(
+            self,
+            "_locked_",
+            owned,
+        )
+
+        # Return the copy of the locked names
+        return owned
 
     @override
     def copy(
@@ -1271,10 +2388,7 @@ class ImmutableBaseObject(MutableBaseObject):
         :rtype: bool
         """
 
-        return self._locked_.get(
-            name,
-            False,
-        )
+        return name in self._locked_
 
     def lock_attribute(
         self,
@@ -1303,64 +2417,102 @@ class ImmutableBaseObject(MutableBaseObject):
         """
 
         # Check, if the passed attribute has been registered
-        if name not in self._locked_ and not allow_new:
+        if not allow_new and not self._is_registered(name):
             # Raise a KeyError exception if the attribute has not been registered
             raise KeyError(f"Attribute '{name}' has not been registered")
 
         # Check, if the attribute is private
-        if name.startswith("_"):
+        if name[:1] == "_":
             # Raise an AttributeError if the attribute is private
             raise AttributeError(f"Cannot lock private attribute '{name}'")
 
         # Check if the attribute should be set
         if value is not None:
             # Set the attribute on the object
-            super().__setattr__(
+            _object_setattr(
+                self,
                 name,
                 value,
             )
 
-        # Check, if the attribute should be set
-        elif allow_new and not hasattr(
-            self,
-            name,
-        ):
+            # Drop the cached hash, as the attributes have changed
+            _object_setattr(
+                self,
+                "_hash_",
+                None,
+            )
+
+        # Check, if the attribute should be set, as it does not exist yet
+        elif allow_new and not self._is_registered(name):
             # Raise a ValueError exception if the attribute has not been registered
             raise ValueError(f"New attribute '{name}' must have a value when locking")
 
-        # Lock the attribute
-        self._locked_[name] = True
+        # Lock the attribute, interning the name so that lookups with names
+        # from attribute access match it by identity
+        self._own_locked().add(sys.intern(name))
 
-    @override
-    def set(
+        # Get the names released with unlock_attribute(), if any
+        unlocked: Optional[set[str]] = getattr(
+            self,
+            "_unlocked_",
+            None,
+        )
+
+        # Check if any attribute has been unlocked
+        if unlocked:
+            # Forget that the attribute has been unlocked
+            unlocked.discard(name)
+
+    def lock_attributes(
         self,
-        key: str,
-        value: Any,
+        names: Iterable[str],
     ) -> None:
         """
-        Set an attribute on the object.
+        Lock several registered attributes at once, making them immutable.
 
-        :param key: The name of the attribute to set.
-        :type key: str
-        :param value: The value to set the attribute to.
-        :type value: Any
+        Every name is checked before any of them is locked.
+
+        :param names: The names of the attributes to lock.
+        :type names: Iterable[str]
 
         :return: None
         :rtype: None
 
         Raises:
-            AttributeError: If the attribute is private.
+            KeyError: If an attribute has not been registered.
+            AttributeError: If an attribute is private.
         """
 
-        # Check if the instance is locked
-        self._check_locked(name=key)
+        # Intern the names, collecting them so that iterators are consumed once
+        interned: list[str] = [sys.intern(name) for name in names]
 
-        # Set the attribute on the object
-        super().set(
-            key,
-            value,
+        # Check all passed attributes before locking any of them
+        for name in interned:
+            # Check, if the passed attribute has been registered
+            if not self._is_registered(name):
+                # Raise a KeyError exception if the attribute has not been registered
+                raise KeyError(f"Attribute '{name}' has not been registered")
+
+            # Check, if the attribute is private
+            if name[:1] == "_":
+                # Raise an AttributeError if the attribute is private
+                raise AttributeError(f"Cannot lock private attribute '{name}'")
+
+        # Lock the attributes in a single call
+        self._own_locked().update(interned)
+
+        # Get the names released with unlock_attribute(), if any
+        unlocked: Optional[set[str]] = getattr(
+            self,
+            "_unlocked_",
+            None,
         )
 
+        # Check if any attribute has been unlocked
+        if unlocked:
+            # Forget that the attributes have been unlocked
+            unlocked.difference_update(interned)
+
     def unlock_attribute(
         self,
         name: str,
@@ -1380,17 +2532,37 @@ class ImmutableBaseObject(MutableBaseObject):
         """
 
         # Check, if the passed attribute has been registered
-        if name not in self._locked_:
+        if not self._is_registered(name):
             # Raise a KeyError exception if the attribute has not been registered
             raise KeyError(f"Attribute '{name}' has not been registered")
 
         # Check, if the attribute is private
-        if name.startswith("_"):
+        if name[:1] == "_":
             # Raise an AttributeError if the attribute is private
             raise AttributeError(f"Cannot unlock private attribute '{name}'")
 
-        # Unlock the attribute
-        self._locked_[name] = False
+        # Check, if the attribute is locked
+        if name in self._locked_:
+            # Unlock the attribute
+            self._own_locked().discard(name)
+
+            # Drop the cached hash, as the object is no longer hashable
+            _object_setattr(
+                self,
+                "_hash_",
+                None,
+            )
+
+        try:
+            # Remember that the attribute has been unlocked, so that update() keeps it unlocked
+            self._unlocked_.add(name)
+        except AttributeError:
+            # Set up the unlocked names with the first unlocked attribute
+            _object_setattr(
+                self,
+                "_unlocked_",
+                {name},
+            )
 
     @override
     def update(
@@ -1410,25 +2582,43 @@ class ImmutableBaseObject(MutableBaseObject):
             AttributeError: If the attribute is private.
         """
 
-        # Update the lock dictionary
-        for key in kwargs.keys():
-            # Check if the instance is locked
-            self._check_locked(name=key)
+        # Get the set of locked names
+        locked: Union[set[str], frozenset[str]] = self._locked_
 
-        # Update the object with key-value pairs
+        # Check all passed attributes before setting any of them
+        for key in kwargs:
+            # Check if the attribute is public and locked
+            if key[:1] != "_" and key in locked:
+                # Raise an AttributeError if the attribute is not allowed to be modified
+                raise AttributeError(
+                    f"Cannot modify immutable field '{key}' of object {type(self).__name__}",
+                )
+
+        # Update the object with key-value pairs, which stores the annotated
+        # fields directly if the class does not customize how they are set
         super().update(
             **kwargs,
         )
 
-        # Update the lock dictionary
-        for key in kwargs.keys():
-            # Check, if the attribute is already locked
-            if key in self._locked_:
-                # Skip the current attribute
-                continue
+        # Drop the cached hash, as directly stored fields bypass __setattr__
+        _object_setattr(
+            self,
+            "_hash_",
+            None,
+        )
 
-            # Lock the attribute
-            self._locked_[key] = True
+        # Check if any attributes are passed
+        if kwargs:
+            # Lock the passed attributes, as the constructor would, except for
+            # the attributes released with unlock_attribute()
+            self._own_locked().update(
+                kwargs.keys()
+                - getattr(
+                    self,
+                    "_unlocked_",
+                    _NO_LOCKS,
+                ),
+            )
 
 
 class BaseObjectBuilder(ImmutableBaseObject):
@@ -1463,7 +2653,7 @@ class BaseObjectBuilder(ImmutableBaseObject):
         """
 
         # Check if the item exists on the object
-        return item in self.configuration
+        return item in self._configuration
 
     @override
     def __delitem__(
@@ -1484,7 +2674,7 @@ class BaseObjectBuilder(ImmutableBaseObject):
         """
 
         # Delete the attribute from the object
-        del self.configuration[key]
+        del self._configuration[key]
 
     @override
     def __getitem__(
@@ -1505,7 +2695,7 @@ class BaseObjectBuilder(ImmutableBaseObject):
         """
 
         # Get the attribute from the object
-        return self.configuration[key]
+        return self._configuration[key]
 
     @override
     def __setitem__(
@@ -1529,7 +2719,7 @@ class BaseObjectBuilder(ImmutableBaseObject):
         """
 
         # Set the attribute on the object
-        self.configuration[key] = value
+        self._configuration[key] = value
 
     @override
     def __str__(
@@ -1543,7 +2733,7 @@ class BaseObjectBuilder(ImmutableBaseObject):
         """
 
         # Return a string representation of the object
-        return str(self.configuration)
+        return str(self._configuration)
 
     def build(self) -> Any:
         """
@@ -1553,10 +2743,13 @@ class BaseObjectBuilder(ImmutableBaseObject):
         :rtype: Any
         """
 
-        raise NotImplementedError(f"{self.__class__.__name__}.build() is not implemented yet.")
+        raise NotImplementedError(f"{type(self).__name__}.build() is not implemented yet.")
 
 
-# ---- Auto-Export -----
+# ---- Exports -----
 
-# Auto-export all non-rpivate symbols
-__all__: Final[list[str]] = [name for name in globals() if not name.startswith("_")]
+__all__: Final[tuple[str, ...]] = (
+    "BaseObjectBuilder",
+    "ImmutableBaseObject",
+    "MutableBaseObject",
+)
@@ -3,12 +3,13 @@ Author: Louis Goodnews
 Date: 2025-08-20
 """
 
-from core.core import ImmutableBaseObject, MutableBaseObject
-
 
 def main() -> None:
     """ """
 
+    # Import the demo classes here, so that importing this module stays cheap
+    from baseobject.core.core import ImmutableBaseObject, MutableBaseObject
+
     # Demo: MutableBaseObject
     print("=== MutableBaseObject Demo ===")
 
@@ -0,0 +1,35 @@
+"""
+Tests for the annotated fields of base object classes.
+"""
+
+from baseobject import MutableBaseObject
+
+
+class Parent(MutableBaseObject):
+    child: "Child"
+    count: int
+
+
+class Child(MutableBaseObject):
+    value: int
+
+
+def test_forward_references_are_resolved_on_first_use() -> None:
+    parent = Parent(child=Child(value=1), count=2)
+
+    assert parent.child.value == 1
+    assert dict(Parent._ANNOTATIONS) == {"child": Child, "count": int}
+
+
+def test_subclasses_without_annotations_inherit_the_fields() -> None:
+    class Empty(Parent):
+        pass
+
+    # Reading the annotations must not hide the fields of the parent
+    assert Empty.__annotations__ == {}
+
+    class Derived(Empty):
+        pass
+
+    assert Derived._ANNOTATION_KEYS == {"child", "count"}
+    assert Derived(count=3).count == 3
@@ -0,0 +1,88 @@
+"""
+Tests for copy() and from_dict() of base objects.
+"""
+
+import copy
+
+import pytest
+
+from baseobject import ImmutableBaseObject, MutableBaseObject
+
+
+class Person(MutableBaseObject):
+    name: str
+    tags: list
+
+
+class Point(ImmutableBaseObject):
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Person(name="Alice", tags=["a"]),
+        Point(x=1, y=2),
+        MutableBaseObject(a=1, b=[2]),
+        ImmutableBaseObject(a=1),
+    ],
+)
+def test_copy_round_trip(obj: MutableBaseObject) -> None:
+    for copied in (obj.copy(), copy.copy(obj)):
+        assert type(copied) is type(obj)
+        assert copied == obj
+        assert copied is not obj
+        assert vars(copied) is not vars(obj)
+        assert list(vars(copied)) == list(vars(obj))
+
+
+def test_copy_is_shallow() -> None:
+    person = Person(name="Alice", tags=["a"])
+
+    copied = person.copy()
+    copied.name = "Bob"
+
+    assert person.name == "Alice"
+    assert copied.tags is person.tags
+
+
+def test_immutable_copy_as_mutable() -> None:
+    copied = Point(x=1, y=2).copy(as_mutable=True)
+
+    assert type(copied) is MutableBaseObject
+    assert (copied.x, copied.y) == (1, 2)
+
+    copied.x = 3
+
+    assert copied.x == 3
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Person(name="Alice", tags=["a"]),
+        Point(x=1, y=2),
+        MutableBaseObject(a=1, b=[2]),
+        ImmutableBaseObject(a=1),
+    ],
+)
+def test_from_dict_round_trip(obj: MutableBaseObject) -> None:
+    for dictionary in (vars(obj), obj.to_dict(allow_leading_underscores=True)):
+        restored = type(obj).from_dict(**dictionary)
+
+        assert type(restored) is type(obj)
+        assert restored == obj
+
+
+def test_from_dict_accepts_constructor_names() -> None:
+    assert Point.from_dict(x=1, y=2) == Point(x=1, y=2)
+    assert Point.from_dict(x=1, y=2).is_locked("x")
+
+
+def test_from_dict_rejects_unknown_keys() -> None:
+    with pytest.raises(TypeError, match="Unexpected argument: 'z'"):
+        Point.from_dict(x=1, z=2)
+
+    with pytest.raises(TypeError, match="Unexpected argument: 'z'"):
+        Person.from_dict(_name="Alice", _z=2)
@@ -0,0 +1,102 @@
+"""
+Tests for MutableBaseObject.deep_copy and ImmutableBaseObject.deep_copy.
+"""
+
+import copy
+
+from baseobject import ImmutableBaseObject, MutableBaseObject
+
+
+class Node(MutableBaseObject):
+    a: object
+    b: object
+
+
+class Frozen(ImmutableBaseObject):
+    a: object
+
+
+def test_deep_copy_copies_nested_containers() -> None:
+    node = Node(a=[1, {"k": (1, [2])}], b={1, 2})
+
+    copied = node.deep_copy()
+
+    assert copied == node
+    assert copied.a is not node.a
+    assert copied.a[1]["k"][1] is not node.a[1]["k"][1]
+
+
+def test_deep_copy_resolves_cycles_to_the_copy() -> None:
+    node = Node(a=1, b=[1])
+    node.b.append(node)
+
+    copied = node.deep_copy()
+
+    assert copied is not node
+    assert copied.b is not node.b
+    assert copied.b[1] is copied
+
+
+def test_deep_copy_keeps_shared_references_across_nested_objects() -> None:
+    shared = [1]
+    outer = Node(a=shared, b=Node(a=shared, b=None))
+
+    copied = outer.deep_copy()
+
+    assert copied.a is not shared
+    assert copied.a is copied.b.a
+
+
+def test_deep_copy_copies_a_shared_nested_object_once() -> None:
+    inner = Node(a=1, b=2)
+
+    copied = Node(a=inner, b=inner).deep_copy()
+
+    assert copied.a is not inner
+    assert copied.a is copied.b
+
+
+def test_deep_copy_as_mutable() -> None:
+    inner = Frozen(a=[1])
+
+    copied = Node(a=inner, b=inner).deep_copy(as_mutable=True)
+
+    assert type(copied) is MutableBaseObject
+    assert type(copied.a) is MutableBaseObject
+    assert copied.a is copied.b
+
+
+def test_deep_copy_of_an_immutable_object_is_locked() -> None:
+    frozen = Frozen(a=[1])
+
+    copied = frozen.deep_copy()
+
+    assert copied.is_locked("a")
+    assert copied.a == frozen.a
+    assert copied.a is not frozen.a
+
+
+def test_deep_copy_keeps_the_identity_of_a_tuple_in_a_cycle() -> None:
+    cycle = ([],)
+    cycle[0].append(cycle)
+
+    copied = Node(a=cycle, b=[cycle]).deep_copy()
+    expected = copy.deepcopy(cycle)
+
+    assert expected[0][0] is expected
+    assert copied.a is not cycle
+    assert copied.a[0] is not cycle[0]
+    assert copied.a[0][0] is copied.a
+    assert copied.b[0] is copied.a
+
+
+def test_deep_copy_keeps_a_value_shared_by_two_fields_shared() -> None:
+    for shared in ([1], {"k": [1]}, ([1],), {1, 2}):
+        node = Node(a=shared, b={"nested": shared})
+
+        copied = node.deep_copy()
+
+        assert copied.a == shared
+        assert copied.a is not shared
+        assert copied.b["nested"] is copied.a
+        assert copied.b["nested"] == copy.deepcopy(node).b["nested"]
@@ -0,0 +1,133 @@
+"""
+Tests for how the fields of base objects are set.
+"""
+
+from baseobject import ImmutableBaseObject, MutableBaseObject
+
+
+class Plain(MutableBaseObject):
+    x: int
+
+
+class Normalized(MutableBaseObject):
+    x: int
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._x = abs(value)
+
+
+class Recording(MutableBaseObject):
+    x: int
+
+    def __setattr__(self, name: str, value: object) -> None:
+        type(self).seen.append(name)
+        super().__setattr__(name, value)
+
+
+Recording.seen = []
+
+
+def test_update_uses_a_custom_field_setter() -> None:
+    normalized = Normalized(x=1)
+
+    normalized.update(x=-5)
+
+    assert normalized.x == 5
+    assert not Normalized._PLAIN_FIELDS
+
+
+def test_update_uses_a_custom_setattr() -> None:
+    recording = Recording(x=1)
+    Recording.seen.clear()
+
+    recording.update(x=2)
+
+    assert recording.x == 2
+    assert "x" in Recording.seen
+    assert not Recording._PLAIN_FIELDS
+
+
+def test_update_stores_plain_fields() -> None:
+    plain = Plain(x=1)
+
+    plain.update(x=2)
+
+    assert Plain._PLAIN_FIELDS
+    assert vars(plain) == {"_x": 2}
+
+
+def test_immutable_classes_keep_plain_fields() -> None:
+    class Point(ImmutableBaseObject):
+        x: int
+
+    assert Point._PLAIN_FIELDS
+
+
+def test_update_sets_every_field_through_a_custom_setattr() -> None:
+    class Audited(ImmutableBaseObject):
+        x: int
+        y: int
+
+        def __setattr__(self, name: str, value: object) -> None:
+            seen.append((name, value))
+            super().__setattr__(name, value)
+
+    seen: list[tuple[str, object]] = []
+    audited = Audited()
+    seen.clear()
+
+    audited.update(x=1, y=2)
+
+    assert seen == [("x", 1), ("_x", 1), ("y", 2), ("_y", 2)]
+    assert (audited.x, audited.y) == (1, 2)
+    assert audited.is_locked("x") and audited.is_locked("y")
+
+
+def test_construction_uses_a_custom_setattr() -> None:
+    Recording.seen.clear()
+
+    recording = Recording(x=1)
+
+    assert Recording.seen == ["_x"]
+    assert recording.x == 1
+
+
+def test_construction_of_unannotated_classes_uses_a_custom_setattr() -> None:
+    class Loose(MutableBaseObject):
+        def __setattr__(self, name: str, value: object) -> None:
+            seen.append(name)
+            super().__setattr__(name, value)
+
+    seen: list[str] = []
+
+    loose = Loose(a=1, b=2)
+
+    assert seen == ["_a", "_b"]
+    assert (loose.a, loose.b) == (1, 2)
+
+
+def test_construction_of_subclasses_uses_a_custom_setattr() -> None:
+    class Child(Recording):
+        pass
+
+    Recording.seen.clear()
+
+    child = Child(x=1)
+
+    assert Recording.seen == ["_x"]
+    assert child.x == 1
+
+
+def test_construction_with_a_custom_field_setter() -> None:
+    normalized = Normalized(x=-1)
+
+    assert vars(normalized) == {"_x": -1}
+
+    normalized.x = -2
+
+    assert normalized.x == 2
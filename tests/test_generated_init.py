@@ -0,0 +1,136 @@
+"""
+Tests comparing the generated '__init__' methods with the generic ones.
+"""
+
+import pytest
+
+from baseobject import ImmutableBaseObject, MutableBaseObject
+
+
+class Item(MutableBaseObject):
+    name: str
+    count: int
+    price: float = 1.5
+
+
+class GenericItem(Item):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+
+
+class Frozen(ImmutableBaseObject):
+    x: int
+    y: int
+
+    def __post_init__(self) -> None:
+        if self.x == 0:
+            self.lock_attribute("y")
+
+
+class GenericFrozen(Frozen):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+
+
+def error_of(cls: type, **kwargs: object) -> tuple[type, str]:
+    with pytest.raises(Exception) as info:
+        cls(**kwargs)
+
+    return (type(info.value), str(info.value))
+
+
+def test_init_is_generated_for_annotated_classes() -> None:
+    assert Item.__init__.__base_init__ is MutableBaseObject.__init__
+    assert Frozen.__init__.__base_init__ is ImmutableBaseObject.__init__
+    assert "__base_init__" not in vars(GenericItem.__init__)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"name": "a"},
+        {"name": "a", "count": "3"},
+        {"name": 1, "count": 2, "price": 3},
+        {"price": None},
+    ],
+)
+def test_generated_init_sets_the_fields_like_the_generic_one(kwargs: dict) -> None:
+    generated = Item(**kwargs)
+    generic = GenericItem(**kwargs)
+
+    assert vars(generated) == vars(generic)
+    assert list(vars(generated)) == ["_name", "_count", "_price"]
+
+
+def test_defaults_are_not_stored_by_either_init() -> None:
+    assert Item()._price is None
+    assert GenericItem()._price is None
+    assert Item.price == 1.5
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"count": "many"},
+        {"unexpected": 1},
+        {"name": "a", "other": 2},
+    ],
+)
+def test_generated_init_raises_like_the_generic_one(kwargs: dict) -> None:
+    assert error_of(Item, **kwargs) == error_of(GenericItem, **kwargs)
+
+
+def test_error_messages_of_the_generated_init() -> None:
+    assert error_of(Item, count="many") == (
+        TypeError,
+        "Invalid type for field 'count': expected <class 'int'>, got <class 'str'>",
+    )
+    assert error_of(Item, unexpected=1) == (
+        TypeError,
+        "Unexpected argument: 'unexpected'",
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"x": 1},
+        {"x": 1, "y": 2},
+        {"y": 2},
+        {"x": 0},
+        {"x": 0, "y": 2},
+    ],
+)
+def test_generated_init_locks_like_the_generic_one(kwargs: dict) -> None:
+    generated = Frozen(**kwargs)
+    generic = GenericFrozen(**kwargs)
+
+    assert vars(generated) == vars(generic)
+    assert set(generated._locked_) == set(generic._locked_)
+
+    for name in ("x", "y"):
+        assert generated.is_locked(name) == generic.is_locked(name)
+
+
+def test_generated_init_shares_the_field_names_as_locked_names() -> None:
+    frozen = Frozen(x=1, y=2)
+
+    assert frozen._locked_ is Frozen._ANNOTATION_KEYS
+
+    frozen.unlock_attribute("x")
+
+    assert Frozen._ANNOTATION_KEYS == {"x", "y"}
+    assert Frozen(x=1, y=2).is_locked("x")
+
+
+def test_subclasses_get_their_own_generated_init() -> None:
+    class Child(Item):
+        pass
+
+    child = Child(name="a")
+
+    assert Child.__init__ is not Item.__init__
+    assert Child.__init__.__base_init__ is MutableBaseObject.__init__
+    assert vars(child) == vars(Item(name="a"))
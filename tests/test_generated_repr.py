@@ -0,0 +1,81 @@
+"""
+Tests comparing the generated '__repr__' methods with the generic one.
+"""
+
+from baseobject import ImmutableBaseObject, MutableBaseObject
+
+
+class Defaults(MutableBaseObject):
+    name: str
+    size: int = 3
+
+
+class Private(ImmutableBaseObject):
+    _secret: str
+    public: int
+
+
+class Custom(Defaults):
+    def __repr__(self) -> str:
+        return f"Custom({self._name})"
+
+
+class Inherited(Custom):
+    pass
+
+
+def test_repr_is_generated_for_annotated_classes() -> None:
+    assert Defaults.__repr__.__base_repr__ is MutableBaseObject.__repr__
+    assert Defaults.__str__ is Defaults.__repr__
+
+
+def test_generated_repr_of_a_class_with_defaults() -> None:
+    defaults = Defaults(name="a")
+
+    assert repr(defaults) == "<Defaults (_name='a', _size=None)>"
+    assert repr(defaults) == MutableBaseObject.__repr__(defaults)
+    assert str(defaults) == repr(defaults)
+
+
+def test_generated_repr_of_a_class_with_private_fields() -> None:
+    private = Private(_secret="s", public=1)
+
+    assert repr(private) == "<Private (__secret='s', _public=1)>"
+    assert repr(private) == MutableBaseObject.__repr__(private)
+
+
+def test_generated_repr_falls_back_when_the_attributes_differ() -> None:
+    defaults = Defaults(name="a")
+    defaults.update(extra=[1])
+
+    assert repr(defaults) == "<Defaults (_name='a', _size=None, extra=[1])>"
+
+    del defaults._size
+
+    assert repr(defaults) == "<Defaults (_name='a', extra=[1])>"
+
+
+def test_generated_repr_falls_back_for_subclass_instances() -> None:
+    class Child(Defaults):
+        __repr__ = Defaults.__repr__
+
+    assert repr(Child(name="a")) == "<Child (_name='a', _size=None)>"
+
+
+def test_custom_repr_is_kept_and_inherited() -> None:
+    assert repr(Custom(name="a")) == "Custom(a)"
+    assert repr(Inherited(name="b")) == "Custom(b)"
+    assert str(Inherited(name="b")) == "Custom(b)"
+    assert not hasattr(Inherited.__repr__, "__base_repr__")
+
+
+def test_str_uses_a_custom_repr_from_a_mixin() -> None:
+    class Mixin:
+        def __repr__(self) -> str:
+            return "Mixin"
+
+    class Mixed(Mixin, Defaults):
+        pass
+
+    assert repr(Mixed(name="a")) == "Mixin"
+    assert str(Mixed(name="a")) == "Mixin"
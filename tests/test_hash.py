@@ -0,0 +1,79 @@
+"""
+Tests for the hash of ImmutableBaseObject.
+"""
+
+import pytest
+
+from baseobject import ImmutableBaseObject, MutableBaseObject
+
+
+class Point(ImmutableBaseObject):
+    x: int
+    y: int
+
+
+class Loose(ImmutableBaseObject):
+    pass
+
+
+def test_mutable_objects_are_not_hashable() -> None:
+    with pytest.raises(TypeError):
+        hash(MutableBaseObject(a=1))
+
+
+def test_equal_objects_have_the_same_hash() -> None:
+    first = Point(x=1, y=2)
+    second = Point(y=2, x=1)
+    third = Point()
+    third.update(x=1, y=2)
+
+    assert first == second == third
+    assert hash(first) == hash(second) == hash(third)
+    assert len({first, second, third}) == 1
+    assert {first: "point"}[third] == "point"
+
+
+def test_objects_with_unlocked_attributes_are_not_hashable() -> None:
+    with pytest.raises(TypeError, match="unlocked attribute 'y'"):
+        hash(Point(x=1))
+
+
+def test_unhashable_values_raise_a_type_error() -> None:
+    with pytest.raises(TypeError):
+        hash(Loose(a=[1]))
+
+
+def test_unlocking_drops_the_cached_hash() -> None:
+    point = Point(x=1, y=2)
+    hash(point)
+
+    point.unlock_attribute("y")
+
+    with pytest.raises(TypeError):
+        hash(point)
+
+
+def test_setting_an_attribute_drops_the_cached_hash() -> None:
+    point = Point(x=1, y=2)
+    hash(point)
+
+    point.unlock_attribute("y")
+    point.y = 3
+    point.lock_attribute("y")
+
+    assert hash(point) == hash(Point(x=1, y=3))
+
+    point.lock_attribute("z", allow_new=True, value=4)
+
+    assert hash(point) != hash(Point(x=1, y=3))
+
+
+def test_deleting_an_attribute_drops_the_cached_hash() -> None:
+    loose = Loose(a=1, b=2)
+    hash(loose)
+
+    loose.unlock_attribute("b")
+    del loose._b
+
+    assert loose == Loose(a=1)
+    assert hash(loose) == hash(Loose(a=1))
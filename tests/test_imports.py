@@ -0,0 +1,63 @@
+"""
+Tests for the import paths of the package.
+"""
+
+import subprocess
+import sys
+
+from pathlib import Path
+
+import baseobject
+
+from baseobject import MutableBaseObject
+from baseobject.main import main
+
+# Source directory of the package
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Script importing the package in a fresh interpreter, recording every
+# lookup of a top-level 'core' module on sys.meta_path
+IMPORT_SCRIPT = """
+import importlib
+import sys
+
+class Recorder:
+    lookups = []
+
+    @classmethod
+    def find_spec(cls, name, path=None, target=None):
+        if name == "core":
+            cls.lookups.append(name)
+        return None
+
+sys.meta_path.insert(0, Recorder)
+before = set(sys.modules)
+module = importlib.import_module("baseobject")
+module.MutableBaseObject
+assert "core" not in set(sys.modules) - before, "top-level core imported"
+assert not Recorder.lookups, "top-level core looked up"
+"""
+
+
+def test_package_imports_without_a_top_level_core() -> None:
+    assert not (SRC / "__init__.py").exists()
+
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        cwd=SRC,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_classes_are_loaded_from_a_single_module(capsys) -> None:
+    main()
+    capsys.readouterr()
+
+    core = sys.modules["baseobject.core.core"]
+
+    assert MutableBaseObject is core.MutableBaseObject
+    assert baseobject.ImmutableBaseObject is core.ImmutableBaseObject
+    assert [name for name in sys.modules if name.endswith("core.core")] == ["baseobject.core.core"]
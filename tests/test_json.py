@@ -0,0 +1,60 @@
+"""
+Tests for from_json and the optional orjson parser.
+"""
+
+import json
+import math
+
+import pytest
+
+from baseobject import MutableBaseObject
+from baseobject.core import core
+
+
+class Record(MutableBaseObject):
+    name: str
+    values: list
+    extra: dict
+
+
+STRINGS = [
+    '{"name": "a", "values": [1, 2.5, null], "extra": {"k": true}}',
+    '{"name": "\\u00e9", "values": [18446744073709551616], "extra": {}}',
+    '{"_name": "b", "_values": [], "_extra": {"nested": [{"x": 1}]}}',
+]
+
+
+@pytest.mark.parametrize("string", STRINGS)
+def test_from_json_is_the_same_with_the_json_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+    string: str,
+) -> None:
+    parsed = Record.from_json(string)
+
+    monkeypatch.setattr(core, "_loads", json.loads)
+
+    assert Record.from_json(string) == parsed
+    assert vars(Record.from_json(string)) == vars(parsed)
+
+
+@pytest.mark.parametrize("string", STRINGS + ['{"a": NaN, "b": 1}'])
+def test_loads_without_orjson_uses_json(
+    monkeypatch: pytest.MonkeyPatch,
+    string: str,
+) -> None:
+    monkeypatch.setattr(core, "orjson", None)
+
+    assert repr(core._loads(string)) == repr(json.loads(string))
+
+
+@pytest.mark.parametrize("string", STRINGS + ['{"a": NaN, "b": 1}'])
+def test_loads_with_orjson_matches_json(string: str) -> None:
+    pytest.importorskip("orjson")
+
+    assert repr(core._loads(string)) == repr(json.loads(string))
+
+
+def test_from_json_round_trips_to_json() -> None:
+    obj = MutableBaseObject(a=1, b=[1.5, "x"], c=math.inf)
+
+    assert MutableBaseObject.from_json(obj.to_json()) == obj
@@ -0,0 +1,163 @@
+"""
+Tests for the attribute locks of ImmutableBaseObject.
+"""
+
+import copy
+
+import pytest
+
+from baseobject import ImmutableBaseObject
+
+
+class Point(ImmutableBaseObject):
+    x: int
+    y: int
+
+
+def test_passed_fields_are_locked() -> None:
+    point = Point(x=1)
+
+    assert point.is_locked("x")
+    assert not point.is_locked("y")
+
+    with pytest.raises(AttributeError):
+        point.x = 2
+
+
+def test_update_locks_new_attributes() -> None:
+    point = Point(x=1)
+
+    point.update(w=1)
+
+    assert point.is_locked("w")
+
+    with pytest.raises(AttributeError):
+        point.w = 2
+
+
+def test_update_keeps_unlocked_attributes_unlocked() -> None:
+    point = Point(x=1, y=2)
+    point.unlock_attribute("x")
+
+    point.update(x=6)
+    point.x = 7
+
+    assert point.x == 7
+    assert not point.is_locked("x")
+    assert point.is_locked("y")
+
+
+def test_lock_attribute_ends_an_unlock() -> None:
+    point = Point(x=1)
+    point.unlock_attribute("x")
+    point.lock_attribute("x")
+
+    assert point.is_locked("x")
+
+    with pytest.raises(AttributeError):
+        point.update(x=2)
+
+
+def test_deleted_unlocked_attribute_is_locked_again_by_update() -> None:
+    point = Point(x=1)
+    point.update(w=1)
+    point.unlock_attribute("w")
+
+    point.update(w=2)
+
+    assert not point.is_locked("w")
+
+    del point.w
+    point.update(w=3)
+
+    assert point.is_locked("w")
+
+
+def test_lock_attribute_rejects_methods_and_unknown_names() -> None:
+    point = Point(x=1)
+
+    for name in ("copy", "lock_attribute", "missing"):
+        with pytest.raises(KeyError):
+            point.lock_attribute(name)
+
+        with pytest.raises(KeyError):
+            point.unlock_attribute(name)
+
+        with pytest.raises(KeyError):
+            point.lock_attributes([name])
+
+        assert not point.is_locked(name)
+
+
+def test_lock_attribute_accepts_fields_and_stored_attributes() -> None:
+    point = Point(x=1)
+    point.update(w=1)
+    point.unlock_attribute("w")
+
+    point.lock_attributes(["y", "w"])
+
+    assert point.is_locked("y")
+    assert point.is_locked("w")
+
+
+def test_lock_attribute_with_allow_new_needs_a_value_for_new_names() -> None:
+    point = Point(x=1)
+
+    with pytest.raises(ValueError):
+        point.lock_attribute("copy", allow_new=True)
+
+    point.lock_attribute("z", allow_new=True, value=3)
+
+    assert point.z == 3
+    assert point.is_locked("z")
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [
+        lambda point: point.copy(),
+        copy.copy,
+        copy.deepcopy,
+    ],
+)
+def test_copies_keep_the_lock_state(copier) -> None:
+    point = Point(x=1, y=2)
+    point.unlock_attribute("x")
+
+    copied = copier(point)
+
+    assert not copied.is_locked("x")
+    assert copied.is_locked("y")
+
+    copied.update(x=3)
+
+    assert copied.x == 3
+    assert not copied.is_locked("x")
+    assert point.x == 1
+
+    copied.lock_attribute("x")
+
+    assert not point.is_locked("x")
+
+
+def test_locking_does_not_leak_into_objects_sharing_the_locked_names() -> None:
+    first = Point(x=1, y=2)
+    second = Point(x=3, y=4)
+    empty = Point()
+    other_empty = Point()
+
+    assert first._locked_ is second._locked_ is Point._ANNOTATION_KEYS
+    assert type(empty._locked_) is frozenset
+    assert empty._locked_ is other_empty._locked_
+
+    first.lock_attributes(["x", "y"])
+    first.unlock_attribute("x")
+    empty.lock_attributes(["x"])
+
+    assert not first.is_locked("x")
+    assert second.is_locked("x")
+    assert Point._ANNOTATION_KEYS == {"x", "y"}
+    assert empty.is_locked("x")
+    assert not other_empty.is_locked("x")
+    assert not Point().is_locked("x")
+    assert other_empty._locked_ == frozenset()
@@ -0,0 +1,70 @@
+"""
+Tests for the attribute and value lookups of base objects.
+"""
+
+from baseobject import ImmutableBaseObject, MutableBaseObject
+
+
+class Person(MutableBaseObject):
+    name: str
+    tags: list
+
+
+def test_contains_value_finds_unhashable_values() -> None:
+    person = Person(name="Alice", tags=["a", "b"])
+    person.update(extra={"k": [1]})
+
+    assert person.contains_value(["a", "b"])
+    assert person.contains_value({"k": [1]})
+    assert not person.contains_value(["a"])
+    assert not person.contains_value({"k": []})
+
+
+def test_contains_value_finds_values_stored_in_private_attributes() -> None:
+    person = Person(name="Alice")
+    person._secret = {1, 2}
+    frozen = ImmutableBaseObject(a=1)
+
+    assert vars(person) == {"_name": "Alice", "_tags": None, "_secret": {1, 2}}
+    assert person.contains_value("Alice")
+    assert person.contains_value({1, 2})
+    assert person.contains_value(None)
+    assert frozen.contains_value(1)
+    assert not frozen.contains_value(2)
+
+
+def test_contains_looks_up_names_not_values() -> None:
+    person = Person(name="Alice")
+
+    assert "name" in person
+    assert "_name" in person
+    assert "Alice" not in person
+    assert "missing" not in person
+
+
+def test_has_finds_property_backed_fields() -> None:
+    person = Person(name="Alice", tags=[])
+
+    assert person.has(key="name")
+    assert person.has(key="_name")
+    assert person.has(key="name", value="Alice")
+    assert person.has(key="tags", value=[])
+    assert not person.has(key="name", value="Bob")
+    assert not person.has(key="name", value=[])
+
+
+def test_has_does_not_find_missing_names() -> None:
+    person = Person(name="Alice")
+
+    assert not person.has(key="missing")
+    assert not person.has(key="missing", value="Alice")
+    assert not person.has(key="tags", value="Alice")
+    assert not person.has()
+
+
+def test_has_finds_values() -> None:
+    person = Person(name="Alice", tags=["a"])
+
+    assert person.has(value="Alice")
+    assert person.has(value=["a"])
+    assert not person.has(value="Bob")
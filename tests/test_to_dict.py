@@ -0,0 +1,81 @@
+"""
+Tests for MutableBaseObject.to_dict.
+"""
+
+from baseobject import MutableBaseObject
+
+
+class Person(MutableBaseObject):
+    name: str
+    age: int
+
+
+class Team(MutableBaseObject):
+    lead: Person
+    size: int
+
+
+def make_person() -> Person:
+    person = Person(name="Alice", age=30)
+    person.update(zeta=1, alpha=2)
+    return person
+
+
+def test_to_dict_keeps_the_attribute_order() -> None:
+    person = make_person()
+
+    assert list(person.to_dict()) == ["zeta", "alpha"]
+    assert list(person.to_dict(allow_leading_underscores=True)) == [
+        "_name",
+        "_age",
+        "zeta",
+        "alpha",
+    ]
+
+
+def test_to_dict_sorts_the_keys() -> None:
+    person = make_person()
+
+    assert list(person.to_dict(sort="ascending")) == ["alpha", "zeta"]
+    assert list(person.to_dict(sort="descending")) == ["zeta", "alpha"]
+    assert list(
+        person.to_dict(
+            allow_leading_underscores=True,
+            sort="ascending",
+        )
+    ) == ["_age", "_name", "alpha", "zeta"]
+    assert list(
+        person.to_dict(
+            allow_leading_underscores=True,
+            sort="descending",
+        )
+    ) == ["zeta", "alpha", "_name", "_age"]
+
+
+def test_to_dict_excludes_keys() -> None:
+    person = make_person()
+
+    assert person.to_dict(
+        allow_leading_underscores=True,
+        exclude=["_age", "zeta", "missing"],
+    ) == {"_name": "Alice", "alpha": 2}
+
+
+def test_to_dict_keeps_nested_objects() -> None:
+    lead = make_person()
+    team = Team(size=3, lead=lead)
+
+    dictionary = team.to_dict(allow_leading_underscores=True)
+
+    assert list(dictionary) == ["_lead", "_size"]
+    assert dictionary["_lead"] is lead
+    assert list(dictionary["_lead"].to_dict(sort="descending")) == ["zeta", "alpha"]
+    assert team.to_dict() == {}
+
+
+def test_to_dict_returns_a_new_dictionary() -> None:
+    person = make_person()
+
+    person.to_dict(allow_leading_underscores=True).clear()
+
+    assert person.name == "Alice"